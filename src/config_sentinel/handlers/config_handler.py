@@ -6,9 +6,60 @@ handlers. Each handler implementation must provide methods for loading and savin
 configuration data in their specific format.
 """
 
+import copy
+import errno
+import hashlib
+import mmap
+import os
+import secrets
+import stat
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Union, Dict
+from threading import Lock
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+# Files at least this large are memory-mapped instead of read into memory.
+_MMAP_THRESHOLD = 16 * 1024
+
+# Parsed configurations shared by all handlers, keyed by handler type and content digest.
+_PARSED_CACHE: "OrderedDict[Tuple[type, bytes], Dict]" = OrderedDict()
+_PARSED_CACHE_SIZE = 32
+_PARSED_CACHE_LOCK = Lock()
+
+
+def _cached_parse(handler: "ConfigHandler", content: Union[bytes, memoryview], digest: bytes) -> Dict:
+    """
+    Parse file contents, reusing the data parsed from identical contents.
+
+    Parsed data is cached process-wide, keyed by the handler type and the digest of the
+    contents, so several Sentinels watching one file parse it once per change. Callers
+    receive a deep copy and may mutate it freely.
+
+    Args:
+        handler: The handler parsing the contents.
+        content: The contents of the configuration file.
+        digest: The digest of ``content``.
+
+    Returns:
+        Dict: The configuration data.
+
+    Raises:
+        ValueError: If the contents are not valid configuration data.
+    """
+    key = (type(handler), digest)
+    with _PARSED_CACHE_LOCK:
+        data = _PARSED_CACHE.get(key)
+        if data is not None:
+            _PARSED_CACHE.move_to_end(key)
+    if data is None:
+        data = handler._parse(content)
+        with _PARSED_CACHE_LOCK:
+            _PARSED_CACHE[key] = data
+            if len(_PARSED_CACHE) > _PARSED_CACHE_SIZE:
+                _PARSED_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
 
 
 class ConfigHandler(ABC):
@@ -17,21 +68,155 @@ class ConfigHandler(ABC):
 
     This class provides the base interface that all configuration handlers must implement.
     It defines methods for loading and saving configuration data, while leaving the
-    specific implementation details to the concrete handler classes.
+    specific implementation details to the concrete handler classes. Handlers implement
+    _parse() to turn raw file contents into configuration data, load(), and save().
 
     Attributes:
         file_path (Path): The path to the configuration file.
+        pretty (bool): Whether to write human-friendly, indented output.
+        _cache_parsed (bool): Whether load_if_changed() shares parsed data between
+            handlers, for formats whose parsing is slower than copying the result.
     """
 
-    def __init__(self, file_path: Union[str, Path]):
+    _cache_parsed = False
+
+    def __init__(self, file_path: Union[str, Path], pretty: bool = True):
         """
         Initialize the configuration handler.
 
         Args:
             file_path (Union[str, Path]): Path to the configuration file. Can be provided
                 as either a string or Path object.
+            pretty (bool): Whether to write human-friendly, indented output. Compact output
+                is faster to write and smaller, at the cost of readability. Defaults to True.
         """
         self.file_path = Path(file_path)  # Ensure file_path is a Path object
+        self.pretty = pretty
+
+    @contextmanager
+    def _read_buffer(self) -> Iterator[Union[bytes, memoryview]]:
+        """
+        Provide the raw contents of the configuration file.
+
+        Files of at least ``_MMAP_THRESHOLD`` bytes are memory-mapped and exposed as a
+        read-only memoryview, so parsers read directly from the page cache instead of
+        a copied buffer. Smaller files are simply read into a bytes object.
+
+        Yields:
+            Union[bytes, memoryview]: The contents of the configuration file. A memoryview
+                is only valid inside the ``with`` block.
+
+        Raises:
+            FileNotFoundError: If the configuration file does not exist.
+        """
+        with open(self.file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+                yield f.read()
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                yield view
+
+    def _atomic_write(self, content: Union[bytes, memoryview]) -> None:
+        """
+        Atomically replace the configuration file.
+
+        The content is written to a uniquely named temporary file next to the configuration
+        file, flushed to disk and renamed over the original. Readers never observe a
+        partially written file, concurrent writers do not share a temporary file, and file
+        watchers see a single event per save. Symbolic links are resolved first, so the
+        file they point to is replaced and the link is kept. A new file gets the default
+        permissions of the process umask, the permissions of an existing file are
+        preserved, and a read-only file is never replaced.
+
+        When the directory does not permit creating a temporary file, the file is written
+        in place instead. The content is fully serialized beforehand, so a failure to
+        serialize never truncates the file.
+
+        Args:
+            content: The serialized configuration data.
+
+        Raises:
+            PermissionError: If the existing configuration file is not writable.
+            OSError: If there is an error writing to the file.
+        """
+        target = Path(os.path.realpath(self.file_path))
+        try:
+            mode = stat.S_IMODE(os.stat(target).st_mode)
+        except FileNotFoundError:
+            mode = None
+        else:
+            if not os.access(target, os.W_OK):
+                raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), str(self.file_path))
+
+        tmp_path = target.with_name(f".{target.name}.{secrets.token_hex(8)}.tmp")
+        try:
+            # Created like any new file, so the kernel applies the process umask
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except PermissionError:
+            with open(target, "wb") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            if mode is not None:
+                os.chmod(tmp_path, mode)
+            os.replace(tmp_path, target)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    @abstractmethod
+    def _parse(self, content: Union[bytes, memoryview]) -> Dict:
+        """
+        Parse the raw contents of the configuration file.
+
+        load_if_changed() passes the buffer it has already read and hashed, so the file
+        is read once per reload.
+
+        Args:
+            content (Union[bytes, memoryview]): The contents of the configuration file. A
+                memoryview is only valid for the duration of the call.
+
+        Returns:
+            Dict: The configuration data.
+
+        Raises:
+            ValueError: If the contents are not valid configuration data.
+        """
+        pass
+
+    def load_if_changed(self, digest: Optional[bytes]) -> Tuple[Optional[Dict], bytes]:
+        """
+        Load the configuration file unless its contents match a previous digest.
+
+        The file is read once: the digest is computed over the same buffer that is then
+        parsed by _parse(), including memory-mapped buffers of large files. Handlers
+        setting ``_cache_parsed`` reuse the data parsed from identical contents.
+
+        Args:
+            digest (Optional[bytes]): The digest returned by an earlier call, or None.
+
+        Returns:
+            Tuple[Optional[Dict], bytes]: The configuration data, or None if the contents
+                match ``digest``, and the digest of the current contents.
+
+        Raises:
+            FileNotFoundError: If the configuration file does not exist.
+            ValueError: If the file contains invalid configuration data.
+        """
+        with self._read_buffer() as content:
+            current = hashlib.blake2b(content, digest_size=16).digest()
+            if current == digest:
+                return None, current
+            if self._cache_parsed:
+                return _cached_parse(self, content, current), current
+            return self._parse(content), current
 
     @abstractmethod
     def load(self) -> Dict:
@@ -3,15 +3,123 @@ JSON configuration file handler.
 
 This module provides functionality for loading and saving configuration data in JSON format.
 It implements the ConfigHandler interface to provide consistent configuration handling.
+
+When the optional ``orjson`` package is installed it is used for parsing and serialization,
+otherwise the standard library ``json`` module is used. Data orjson rejects, such as integers
+beyond 64 bits, is written with the ``json`` module, and dates, times and dataclasses, which
+orjson would write as strings and objects, are rejected as the ``json`` module rejects them.
+UUIDs and enums, which orjson writes natively, are the remaining difference.
 """
 
 # Standard library imports
 import json
-from typing import Dict
+from typing import Dict, Union
+
+# Third-party imports
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
 
 # Local imports
 from config_sentinel.handlers.config_handler import ConfigHandler
 
+_pretty_encoder = json.JSONEncoder(indent=2)
+_compact_encoder = json.JSONEncoder(separators=(",", ":"))
+
+
+def _stdlib_dumps(data: Dict, pretty: bool) -> bytes:
+    """
+    Serialize configuration data with the json module.
+
+    Args:
+        data: The configuration data to serialize.
+        pretty: Whether to indent the output.
+
+    Returns:
+        The UTF-8 encoded JSON document.
+
+    Raises:
+        TypeError: If the data contains objects that cannot be serialized to JSON.
+    """
+    encoder = _pretty_encoder if pretty else _compact_encoder
+    return encoder.encode(data).encode("utf-8")
+
+
+if orjson is not None:
+    # Hand dates, times and dataclasses to the default, which rejects them like the json module
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def _reject(obj: object) -> None:
+        """
+        Reject an object orjson was told not to serialize.
+
+        Args:
+            obj: The object that cannot be serialized.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def _loads(content: Union[bytes, memoryview]) -> Dict:
+        """
+        Parse a JSON document with orjson.
+
+        Args:
+            content: The UTF-8 encoded JSON document.
+
+        Returns:
+            The parsed data.
+
+        Raises:
+            JSONDecodeError: If the document is not valid JSON.
+        """
+        return orjson.loads(content)
+
+    def _dumps(data: Dict, pretty: bool) -> bytes:
+        """
+        Serialize configuration data with orjson, falling back to the json module.
+
+        Args:
+            data: The configuration data to serialize.
+            pretty: Whether to indent the output.
+
+        Returns:
+            The UTF-8 encoded JSON document.
+
+        Raises:
+            TypeError: If the data contains objects that cannot be serialized to JSON.
+        """
+        option = _OPTIONS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(data, option=option, default=_reject)
+        except TypeError:
+            # orjson rejects some data the json module accepts, such as integers
+            # beyond 64 bits, so what can be saved does not depend on orjson
+            return _stdlib_dumps(data, pretty)
+
+    JSONDecodeError = orjson.JSONDecodeError
+else:  # pragma: no cover - exercised only without orjson installed
+    def _loads(content: Union[bytes, memoryview]) -> Dict:
+        """
+        Parse a JSON document with the json module.
+
+        Args:
+            content: The UTF-8 encoded JSON document.
+
+        Returns:
+            The parsed data.
+
+        Raises:
+            JSONDecodeError: If the document is not valid JSON.
+        """
+        return json.loads(bytes(content))
+
+    _dumps = _stdlib_dumps
+
+    JSONDecodeError = json.JSONDecodeError
+
 
 class JSONHandler(ConfigHandler):
     """
@@ -33,13 +141,29 @@ class JSONHandler(ConfigHandler):
             ValueError: If the JSON file contains invalid syntax.
         """
         try:
-            with open(self.file_path, "r") as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Failed to parse configuration: {e}")
+            with self._read_buffer() as content:
+                return self._parse(content)
         except FileNotFoundError:
             return {}
 
+    def _parse(self, content: Union[bytes, memoryview]) -> Dict:
+        """
+        Parse the raw contents of a JSON configuration file.
+
+        Args:
+            content: The contents of the configuration file.
+
+        Returns:
+            Dict: The configuration data.
+
+        Raises:
+            ValueError: If the contents contain invalid JSON syntax.
+        """
+        try:
+            return _loads(content)
+        except JSONDecodeError as e:
+            raise ValueError(f"Failed to parse configuration: {e}")
+
     def save(self, data: Dict) -> None:
         """
         Save configuration data to a JSON file.
@@ -51,5 +175,5 @@ class JSONHandler(ConfigHandler):
             OSError: If there is an error writing to the file.
             TypeError: If the data contains objects that cannot be serialized to JSON.
         """
-        with open(self.file_path, 'w') as f:
-            json.dump(data, f, indent=4)
\ No newline at end of file
+        content = _dumps(data, self.pretty)
+        self._atomic_write(content)
@@ -3,19 +3,72 @@ TOML configuration file handler.
 
 This module provides functionality for loading and saving configuration data in TOML format.
 It implements the ConfigHandler interface to provide consistent configuration handling.
+
+TOML has no null type, so None values are written as empty strings and empty strings are
+read back as None.
 """
 
 # Standard library imports
-from typing import Any, Dict, List, Union
+from typing import Dict, List, Union
 
 # Third-party imports
-from tomli import TOMLDecodeError, load as toml_load
-from tomli_w import dump as toml_dump
+from tomli import TOMLDecodeError, loads as toml_loads
+from tomli_w import dumps as toml_dumps
 
 # Local imports
 from config_sentinel.handlers.config_handler import ConfigHandler
 
 
+def _restore_none(data: Union[Dict, List]) -> Union[Dict, List]:
+    """
+    Restore empty strings to None values in the data structure, in place.
+
+    The structure is walked iteratively, so deeply nested data cannot exceed the
+    recursion limit and no containers are rebuilt.
+
+    Args:
+        data: The data structure to process.
+
+    Returns:
+        The same data structure with empty strings converted to None.
+    """
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        for key, value in node.items() if isinstance(node, dict) else enumerate(node):
+            if value == "":
+                node[key] = None
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
+    return data
+
+
+def _replace_none(data: Union[Dict, List]) -> Union[Dict, List]:
+    """
+    Replace None values with empty strings in a copy of the data structure.
+
+    The structure is walked iteratively. Containers are shallow-copied on the way down,
+    so the caller's data is left untouched without a separate deep copy.
+
+    Args:
+        data: The data structure to process.
+
+    Returns:
+        A copy of the data structure with None values converted to empty strings.
+    """
+    root = data.copy()
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        for key, value in node.items() if isinstance(node, dict) else enumerate(node):
+            if value is None:
+                node[key] = ""
+            elif isinstance(value, (dict, list)):
+                node[key] = value = value.copy()
+                stack.append(value)
+    return root
+
+
 class TOMLHandler(ConfigHandler):
     """
     Handler for TOML configuration files.
@@ -23,8 +76,12 @@ class TOMLHandler(ConfigHandler):
     This class implements the ConfigHandler interface for working with TOML format
     configuration files. It provides methods to load and save configuration data
     while handling common TOML-related errors.
+
+    TOML has no compact representation, so the ``pretty`` option has no effect.
     """
 
+    _cache_parsed = True
+
     def load(self) -> Dict:
         """
         Load and parse the TOML configuration file.
@@ -35,28 +92,27 @@ class TOMLHandler(ConfigHandler):
         Raises:
             ValueError: If the TOML file contains invalid syntax.
         """
-        def restore_none(data: Union[Dict, List, Any]) -> Union[Dict, List, Any]:
-            """
-            Recursively restore empty strings to None values in the data structure.
-
-            Args:
-                data: The data structure to process.
-
-            Returns:
-                The processed data structure with empty strings converted to None.
-            """
-            if isinstance(data, dict):
-                return {k: restore_none(v) for k, v in data.items()}
-            elif isinstance(data, list):
-                return [restore_none(v) for v in data]
-            return None if data == "" else data
-
         try:
-            with open(self.file_path, "rb") as f:
-                data = toml_load(f)
-                return restore_none(data)
+            with self._read_buffer() as content:
+                return self._parse(content)
         except FileNotFoundError:
             return {}
+
+    def _parse(self, content: Union[bytes, memoryview]) -> Dict:
+        """
+        Parse the raw contents of a TOML configuration file.
+
+        Args:
+            content: The contents of the configuration file.
+
+        Returns:
+            Dict: The configuration data, with empty strings restored to None.
+
+        Raises:
+            ValueError: If the contents contain invalid TOML syntax.
+        """
+        try:
+            return _restore_none(toml_loads(str(content, "utf-8")))
         except TOMLDecodeError as e:
             raise ValueError(f"Failed to parse configuration: {e}")
 
@@ -71,22 +127,5 @@ class TOMLHandler(ConfigHandler):
             OSError: If there is an error writing to the file.
             TypeError: If the data contains objects that cannot be serialized to TOML.
         """
-        def replace_none(data: Union[Dict, List, Any]) -> Union[Dict, List, Any]:
-            """
-            Recursively replace None values with empty strings in the data structure.
-
-            Args:
-                data: The data structure to process.
-
-            Returns:
-                The processed data structure with None values converted to empty strings.
-            """
-            if isinstance(data, dict):
-                return {k: replace_none(v) for k, v in data.items()}
-            elif isinstance(data, list):
-                return [replace_none(v) for v in data]
-            return "" if data is None else data
-
-        serialized_data = replace_none(data)
-        with open(self.file_path, "wb") as f:
-            toml_dump(serialized_data, f)
+        content = toml_dumps(_replace_none(data)).encode("utf-8")
+        self._atomic_write(content)
@@ -3,18 +3,71 @@ YAML configuration file handler.
 
 This module provides functionality for loading and saving configuration data in YAML format.
 It implements the ConfigHandler interface to provide consistent configuration handling.
+
+The libyaml-backed loader and dumper are used when PyYAML was built with libyaml support,
+otherwise the pure-Python implementations are used.
 """
 
 # Standard library imports
-from typing import Any, Dict
+import io
+import logging
+from threading import Lock
+from typing import Any, BinaryIO, Dict, Union
 from pathlib import Path
 
 # Third-party imports
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - exercised only without libyaml
+    from yaml import SafeDumper, SafeLoader
+
 # Local imports
 from config_sentinel.handlers.config_handler import ConfigHandler
 
+# Number of leading bytes inspected for a file holding only whitespace and comments.
+_PEEK_SIZE = 4096
+
+if not yaml.__with_libyaml__:  # pragma: no cover - exercised only without libyaml
+    logging.getLogger(__name__).warning(
+        "PyYAML was built without libyaml support, falling back to the pure-Python YAML parser."
+    )
+
+
+def _is_blank(head: Union[bytes, memoryview]) -> bool:
+    """
+    Check whether a small file holds only whitespace and comments, needing no parsing.
+
+    Args:
+        head: Up to ``_PEEK_SIZE`` leading bytes of the file.
+
+    Returns:
+        True if the whole file was inspected and holds no YAML content.
+    """
+    return len(head) < _PEEK_SIZE and all(
+        not line.strip() or line.lstrip().startswith(b"#") for line in bytes(head).splitlines()
+    )
+
+
+def _safe_load(stream: Union[bytes, BinaryIO]) -> Dict:
+    """
+    Parse a YAML document with the safe loader.
+
+    Args:
+        stream: The document, or a binary file object to read it from.
+
+    Returns:
+        Dict: The parsed data, or an empty dictionary for an empty document.
+
+    Raises:
+        ValueError: If the document contains invalid YAML syntax.
+    """
+    try:
+        return yaml.load(stream, Loader=SafeLoader) or {}
+    except yaml.YAMLError as e:
+        raise ValueError(f"Failed to parse configuration: {e}")
+
 
 class YAMLHandler(ConfigHandler):
     """
@@ -23,41 +76,68 @@ class YAMLHandler(ConfigHandler):
     This class implements the ConfigHandler interface for working with YAML format
     configuration files. It provides methods to load and save configuration data
     while handling common YAML-related errors.
+
+    Attributes:
+        _buffer (io.BytesIO): Output buffer reused across saves.
+        _buffer_lock (Lock): A lock guarding the output buffer.
     """
 
-    def __init__(self, file_path: Path):
+    _cache_parsed = True
+
+    def __init__(self, file_path: Path, pretty: bool = True):
         """
         Initialize YAML handler.
         
         Args:
             file_path: Path to the YAML configuration file
+            pretty: Whether to write block style YAML with sorted keys. When False, the
+                emitter picks flow style for collections of scalars, does not wrap lines
+                and keeps the key order. Defaults to True.
         """
-        self.file_path = file_path
+        super().__init__(file_path, pretty)
+        self._buffer = io.BytesIO()
+        self._buffer_lock = Lock()
 
     def load(self) -> Dict:
         """
         Load and parse the YAML configuration file.
 
         Returns:
-            Dict: The configuration data loaded from the YAML file.
+            Dict: The configuration data loaded from the YAML file. Empty documents,
+                including files holding only comments, load as an empty dictionary.
 
         Raises:
             ValueError: If the YAML file contains invalid syntax.
         """
         try:
-            with open(self.file_path, "r") as f:
-                content = f.read()
-                # Explicitly check if content is non-empty but not valid YAML
-                try:
-                    data = yaml.safe_load(content)
-                    if data is None and content.strip():  # Non-empty but invalid
-                        raise ValueError("Failed to parse configuration: Invalid YAML content.")
-                    return data or {}
-                except yaml.YAMLError as e:
-                    raise ValueError(f"Failed to parse configuration: {e}")
+            with open(self.file_path, "rb") as f:
+                if _is_blank(f.read(_PEEK_SIZE)):
+                    return {}
+                f.seek(0)
+                # Parse straight from the file handle rather than buffering its content
+                return _safe_load(f)
         except FileNotFoundError:
             return {}
 
+    def _parse(self, content: Union[bytes, memoryview]) -> Dict:
+        """
+        Parse the raw contents of a YAML configuration file.
+
+        Args:
+            content: The contents of the configuration file.
+
+        Returns:
+            Dict: The configuration data. Empty documents, including files holding only
+                comments, parse as an empty dictionary.
+
+        Raises:
+            ValueError: If the contents contain invalid YAML syntax.
+        """
+        if _is_blank(content[:_PEEK_SIZE]):
+            return {}
+        # The loader does not accept memoryviews of memory-mapped files
+        return _safe_load(content if isinstance(content, bytes) else bytes(content))
+
     def save(self, data: Dict) -> None:
         """
         Save configuration data to a YAML file, overwriting any existing content.
@@ -69,6 +149,14 @@ class YAMLHandler(ConfigHandler):
             OSError: If there is an error writing to the file.
             yaml.YAMLError: If the data cannot be serialized to YAML.
         """
-        # Save the configuration, overwriting any existing content
-        with open(self.file_path, "w") as f:
-            yaml.safe_dump(data, f)
\ No newline at end of file
+        # Serialize into the reused buffer, then overwrite any existing content
+        with self._buffer_lock:
+            self._buffer.seek(0)
+            self._buffer.truncate()
+            if self.pretty:
+                yaml.dump(data, self._buffer, Dumper=SafeDumper, encoding="utf-8")
+            else:
+                yaml.dump(data, self._buffer, Dumper=SafeDumper, encoding="utf-8",
+                          default_flow_style=None, width=1_000_000, sort_keys=False)
+            with self._buffer.getbuffer() as content:
+                self._atomic_write(content)
@@ -1,18 +1,23 @@
 """
 A module for managing configuration files with automatic reloading capabilities.
 
-This module provides a singleton class that handles configuration file management,
+This module provides a class that handles configuration file management,
 including loading, saving, and watching for changes. It supports nested dataclasses
 and provides dot notation access to configuration values.
 """
 
 # Standard imports
+import copy
 import inspect
 import logging
-from dataclasses import asdict, is_dataclass
+import sys
+from contextlib import contextmanager
+from dataclasses import MISSING, Field, fields, is_dataclass
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from threading import Lock
-from typing import Any, Optional, Type
+from threading import Lock, RLock, Timer, current_thread
+from typing import Any, Callable, Dict, FrozenSet, Iterator, Mapping, Optional, Tuple, Type, get_type_hints
 
 # Third-party imports
 from watchdog.events import FileSystemEventHandler
@@ -21,91 +26,477 @@ from watchdog.observers import Observer
 # Local imports
 from config_sentinel.handlers import ConfigHandler
 
+__all__ = ['Sentinel']
+
+
+@lru_cache(maxsize=None)
+def _field_specs(cls: Type[Any]) -> Tuple[Tuple[str, Any, bool, Field], ...]:
+    """
+    Get the field metadata of a dataclass, computed once per class.
+
+    String annotations, such as those written under ``from __future__ import annotations``,
+    are resolved to the types they name, so nested dataclasses are recognised. Annotations
+    that cannot be resolved, such as names only imported under ``TYPE_CHECKING``, are kept
+    as written without affecting the other fields.
+
+    Args:
+        cls: The dataclass type to inspect.
+
+    Returns:
+        A tuple of (name, type, type is a dataclass, field) entries, one per field.
+    """
+    try:
+        hints = get_type_hints(cls)
+    except Exception:
+        hints = _resolve_annotations(cls)
+    specs = []
+    for f in fields(cls):
+        field_type = hints.get(f.name, f.type)
+        specs.append((f.name, field_type, is_dataclass(field_type), f))
+    return tuple(specs)
+
+
+def _resolve_annotations(cls: Type[Any]) -> Dict[str, Any]:
+    """
+    Resolve the annotations of a class and its bases one by one.
+
+    Each string annotation is evaluated in the namespace of the class declaring it, as
+    get_type_hints() does, but a failure only keeps that annotation as written.
+
+    Args:
+        cls: The class whose annotations to resolve.
+
+    Returns:
+        A mapping of attribute names to their resolved or original annotations.
+    """
+    hints = {}
+    for base in reversed(cls.__mro__):
+        module = sys.modules.get(base.__module__)
+        globalns = vars(module) if module is not None else {}
+        for name, annotation in inspect.get_annotations(base).items():
+            if isinstance(annotation, str):
+                try:
+                    annotation = eval(annotation, globalns, dict(vars(base)))
+                except Exception:
+                    pass
+            hints[name] = annotation
+    return hints
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: Type[Any]) -> Optional[FrozenSet[str]]:
+    """
+    Get the field names of a dataclass, computed once per class.
+
+    Args:
+        cls: The type to inspect.
+
+    Returns:
+        The names of the dataclass fields, or None if the type is not a dataclass.
+    """
+    return frozenset(name for name, *_ in _field_specs(cls)) if is_dataclass(cls) else None
+
+
+def _has_field(obj: Any, name: str) -> bool:
+    """
+    Check whether an object has a settable configuration attribute.
+
+    Dataclass instances are checked against their cached field names, other objects
+    fall back to ``hasattr``.
+
+    Args:
+        obj: The object to check.
+        name: The attribute name.
+
+    Returns:
+        True if the attribute exists, False otherwise.
+    """
+    names = _field_names(type(obj))
+    return name in names if names is not None else hasattr(obj, name)
+
+
+def _default_value(cls: Type[Any], f: Field) -> Any:
+    """
+    Get the default value of a dataclass field without instantiating the dataclass.
+
+    Args:
+        cls: The dataclass type that owns the field.
+        f: The field to get the default value of.
+
+    Returns:
+        A fresh default value for the field.
+    """
+    if f.default_factory is not MISSING:
+        return f.default_factory()
+    if f.default is not MISSING:
+        return f.default
+    # Fields without a declared default are set in __post_init__, copy the value from a
+    # default instance built once per class
+    return copy.deepcopy(getattr(_default_instance(cls), f.name))
+
+
+@lru_cache(maxsize=None)
+def _default_instance(cls: Type[Any]) -> Any:
+    """
+    Get a default-constructed instance of a dataclass, created once per class.
+
+    The instance is shared and must not be modified, callers copy the values they use.
+
+    Args:
+        cls: The dataclass type to instantiate.
+
+    Returns:
+        The default instance of the dataclass.
+    """
+    return cls()
+
+
+@lru_cache(maxsize=None)
+def _compile_merge(cls: Type[Any]) -> Optional[Callable[[Any, Dict], Any]]:
+    """
+    Generate a merge function specialised for a dataclass and its nested dataclasses.
+
+    The generated function takes ``(instance, values)`` and behaves like the generic merge
+    in Sentinel._from_dict, with the loop over the fields unrolled into straight-line code.
+    It is compiled once per dataclass.
+
+    Args:
+        cls: The dataclass type to generate the merge function for.
+
+    Returns:
+        The generated merge function, or None if it could not be generated.
+    """
+    namespace: Dict[str, Any] = {"_default_value": _default_value}
+    functions: Dict[Type[Any], str] = {}
+    sources = []
+
+    def emit(model: Type[Any]) -> str:
+        if model in functions:
+            return functions[model]
+        index = len(functions)
+        name = functions[model] = f"_merge_{index}"
+        namespace[f"_cls_{index}"] = model
+
+        lines = [
+            f"def {name}(instance, values):",
+            "    if instance is None:",
+            f"        instance = _cls_{index}()",
+        ]
+        for position, (key, field_type, is_nested, f) in enumerate(_field_specs(model)):
+            namespace[f"_field_{index}_{position}"] = f
+            lines.append(f"    if {key!r} in values:")
+            if is_nested:
+                nested = emit(field_type)
+                lines += [
+                    f"        value = values[{key!r}]",
+                    "        if isinstance(value, dict):",
+                    f"            value = {nested}(getattr(instance, {key!r}, None), value)",
+                    f"        instance.{key} = value",
+                ]
+            else:
+                lines.append(f"        instance.{key} = values[{key!r}]")
+            lines += [
+                f"    elif getattr(instance, {key!r}, None) is None:",
+                f"        instance.{key} = _default_value(_cls_{index}, _field_{index}_{position})",
+            ]
+        lines.append("    return instance")
+        sources.append("\n".join(lines))
+        return name
+
+    try:
+        entry = emit(cls)
+        exec("\n\n".join(sources), namespace)
+    except Exception:
+        return None
+    return namespace[entry]
+
+
+# Types serialized as-is, checked first to skip the generic conversion.
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _to_builtin(o: Any) -> Any:
+    """
+    Convert a value into plain dictionaries, lists and scalars.
+
+    Dataclass instances are converted field by field with the generated function for
+    their class, lists, tuples and dictionaries are converted recursively and any other
+    value is returned as-is.
+
+    Args:
+        o: The value to convert.
+
+    Returns:
+        The converted value.
+    """
+    if type(o) in _SCALAR_TYPES:
+        return o
+    if is_dataclass(o) and not isinstance(o, type):
+        to_dict = _compile_to_dict(type(o))
+        if to_dict is not None:
+            return to_dict(o)
+        return {key: _to_builtin(getattr(o, key)) for key, *_ in _field_specs(type(o))}
+    if isinstance(o, list):
+        return [_to_builtin(i) for i in o]
+    if isinstance(o, tuple):
+        return tuple(_to_builtin(i) for i in o)
+    if isinstance(o, dict):
+        return {k: _to_builtin(v) for k, v in o.items()}
+    return o
+
+
+@lru_cache(maxsize=None)
+def _compile_to_dict(cls: Type[Any]) -> Optional[Callable[[Any], Dict]]:
+    """
+    Generate a function converting instances of a dataclass into a dictionary.
+
+    The generated function reads every field directly and builds the dictionary in a
+    single expression, passing scalar values through and everything else to
+    ``_to_builtin``. It is compiled once per dataclass.
+
+    Args:
+        cls: The dataclass type to generate the conversion function for.
+
+    Returns:
+        The generated conversion function, or None if it could not be generated.
+    """
+    namespace: Dict[str, Any] = {"_to_builtin": _to_builtin, "_SCALAR_TYPES": _SCALAR_TYPES}
+    items = "".join(
+        f"        {key!r}: value if type(value := o.{key}) in _SCALAR_TYPES else _to_builtin(value),\n"
+        for key, *_ in _field_specs(cls)
+    )
+    try:
+        exec(f"def _to_dict(o):\n    return {{\n{items}    }}", namespace)
+    except Exception:
+        return None
+    return namespace["_to_dict"]
+
 
 class Sentinel(FileSystemEventHandler):
     """
-    A singleton class that manages configuration files with automatic reloading.
+    A class that manages configuration files with automatic reloading.
 
     This class implements the FileSystemEventHandler to watch for file changes and
     provides methods to load, save, and access configuration values. It supports
     nested dataclasses and provides dot notation access to configuration values.
 
+    There is one instance per configuration model and file: constructing a Sentinel for a
+    model and file that are already managed returns the existing instance, whose handler
+    and settings are kept. Calling stop_watching() releases the instance.
+
     Attributes:
-        _instance: The singleton instance of the class.
-        configuration: The user-defined configuration object.
+        _instances: The active instances, keyed by (config_model, resolved file_path).
+        _instances_lock: A lock guarding the creation and initialization of instances.
+        _registry_key: The key of this instance in _instances.
+        configuration: The user-defined configuration object, loaded on first access.
         config_model: The dataclass type used for the configuration.
         handler: The ConfigHandler instance used for file operations.
         file_path: The path to the configuration file.
+        _watched_path: The configuration file path as reported in file system events.
         _observer: The file system observer for watching config changes.
         logger: The logger instance for this class.
-        _lock: A lock for thread-safe operations.
+        _lock: A lock guarding the swap of the configuration object.
+        _mutation_lock: A lock serialising set() and update() with merging a reload into
+            the configuration, so neither overwrites the other's changes.
+        _reload_lock: A lock serialising reloads of the configuration file.
+        _load_lock: A lock guarding the initial, lazy load of the configuration file.
+        _loaded: Whether the configuration file has been loaded.
+        _parent_verified: Whether the configuration directory is known to exist.
+        _debounce_delay: Seconds without further file events to wait for before reloading.
+        _reload_timer: The pending debounced reload, if any.
+        _timer_lock: A lock guarding the replacement of the pending reload timer.
+        _stopped: Whether stop_watching() was called, after which no reload is scheduled.
+        _last_stat: The (mtime, size, inode) of the configuration file when it was last
+            loaded or saved, used to skip reloading an unchanged file.
+        _raw_digest: The digest of the file contents last loaded, used to skip reparsing a
+            file rewritten with identical contents.
+        _last_saved: The data written by the last save, used to skip writing unchanged data.
+        _save_suspended: The depth of nested batch() blocks deferring saves, guarded by
+            the mutation lock.
+        _save_dirty: Whether a save was deferred by batch().
+        _get_cache: Compiled attribute getters for keys passed to get().
+        _set_cache: Compiled (parent getter, attribute name) pairs for keys passed to set().
     """
 
-    _instance = None
-    configuration: Optional[Any] = None  # Holds the user-defined config object
+    _instances: Dict[Tuple[Type[Any], Path], "Sentinel"] = {}
+    _instances_lock = Lock()
+    _initialized = False
+    _configuration: Optional[Any] = None  # Holds the user-defined config object
 
-    def __new__(cls, *args, **kwargs):
-        """Create or return the singleton instance of the class."""
-        if not cls._instance:
-            cls._instance = super(Sentinel, cls).__new__(cls)
-        return cls._instance
+    def __new__(cls, config_model: Type[Any], handler: ConfigHandler, *args, **kwargs):
+        """Create or return the instance managing config_model in the handler's file."""
+        key = (config_model, handler.file_path.resolve())
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = cls._instances[key] = super(Sentinel, cls).__new__(cls)
+        return instance
 
-    def __init__(self, config_model: Type[Any], handler: ConfigHandler):
+    def __init__(self, config_model: Type[Any], handler: ConfigHandler, debounce_ms: int = 200):
         """
         Initialize the Sentinel instance.
 
         Args:
             config_model: The dataclass type used for the configuration.
             handler: The ConfigHandler instance used for file operations.
+            debounce_ms: Milliseconds without further file events to wait for before
+                reloading a changed configuration file. Defaults to 200.
 
         Raises:
             OSError: If directory creation fails due to permissions or other OS issues.
         """
-        if hasattr(self, "_initialized") and self._initialized:
-            return
+        # A thread constructing the same instance concurrently waits here, starting one observer
+        with self._instances_lock:
+            if self._initialized:
+                return
 
-        self.logger = logging.getLogger(__name__)
-        self.logger.propagate = True
+            self.logger = logging.getLogger(__name__)
+            self.logger.propagate = True
 
-        self.config_model = config_model
-        self.handler = handler
-        self.file_path = handler.file_path
-        
-        try:
-            self.file_path.parent.mkdir(parents=True, exist_ok=True)
-        except OSError as e:
-            self.logger.error(f"Failed to create directory {self.file_path.parent}: {e}")
-            raise OSError(f"Failed to create configuration directory: {e}") from e
-            
-        self._observer = Observer()
-        self._lock = Lock()
-        self._load_config()
-        self._observer.schedule(self, path=self.file_path.parent, recursive=False)
-        self._observer.start()
-        self._initialized = True
+            self.config_model = config_model
+            self.handler = handler
+            self.file_path = handler.file_path
+            self._watched_path = str(self.file_path)
+            self._registry_key = (config_model, self.file_path.resolve())
+
+            try:
+                self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                self.logger.error(f"Failed to create directory {self.file_path.parent}: {e}")
+                raise OSError(f"Failed to create configuration directory: {e}") from e
+            self._parent_verified = True
+
+            self._observer = Observer()
+            self._lock = Lock()
+            self._mutation_lock = RLock()
+            self._reload_lock = Lock()
+            self._debounce_delay = debounce_ms / 1000
+            self._reload_timer: Optional[Timer] = None
+            self._timer_lock = Lock()
+            self._stopped = False
+            self._last_stat = None
+            self._raw_digest: Optional[bytes] = None
+            self._last_saved: Optional[dict] = None
+            self._save_suspended = 0
+            self._save_dirty = False
+            self._get_cache: Dict[str, Callable[[Any], Any]] = {}
+            self._set_cache: Dict[str, Tuple[Callable[[Any], Any], str]] = {}
+            self._load_lock = Lock()
+            self._loaded = False
+            self._observer.schedule(self, path=self.file_path.parent, recursive=False)
+            self._observer.start()
+            self._initialized = True
+
+    @property
+    def configuration(self) -> Any:
+        """The user-defined configuration object, loaded from the file on first access."""
+        if not self._loaded:
+            self._ensure_loaded()
+        return self._configuration
+
+    @configuration.setter
+    def configuration(self, configuration: Any):
+        self._swap_configuration(configuration)
+
+    def _ensure_loaded(self):
+        """Load the configuration file if it has not been loaded yet."""
+        if not self._loaded:
+            with self._load_lock:
+                if not self._loaded:
+                    self._load_config()
 
     def _load_config(self):
         """
         Load the configuration from file or create default if file is empty/invalid.
+
+        The new configuration object is built without holding the lock, which only guards
+        swapping it in, so readers never wait on file I/O or parsing. Merging and swapping
+        hold the mutation lock, so a concurrent set() is applied before the copy is taken
+        or to the new object, never to the object being replaced.
+
+        A file whose stat is unchanged is not read at all, and a file rewritten with the
+        same contents, for example by an editor saving without changes, is not parsed.
+        Recording the stat of a reloaded file forgets the data last saved, so the next
+        save_config() is not skipped for data matching an older save.
         """
-        with self._lock:
+        with self._reload_lock:
             try:
-                data = self.handler.load()
+                stat = self._stat_config()
+                if stat is not None and stat == self._last_stat:
+                    self.logger.debug("Configuration file %s is unchanged, skipping reload.", self.file_path)
+                    return
+                if stat is None:
+                    data, digest = self.handler.load(), None
+                else:
+                    data, digest = self.handler.load_if_changed(self._raw_digest)
+                    if data is None:
+                        self.logger.debug("Configuration file %s has the same contents, skipping reload.",
+                                          self.file_path)
+                        self._last_stat = stat
+                        self._last_saved = None
+                        return
                 if not data:
                     self.logger.warning(f"Configuration file {self.file_path} is empty. Using defaults.")
-                    self.configuration = self.config_model()
-                    self.save_config()  # Ensure file creation
+                    self._reset_to_defaults()
+                    if stat is None:
+                        self.save_config()  # Ensure file creation
                 else:
-                    self.configuration = self._from_dict(data)
+                    with self._mutation_lock:
+                        self._swap_configuration(self._from_dict(data))
+                    self._last_stat = stat
+                    self._last_saved = None
+                    self._raw_digest = digest
                 self.logger.info("Configuration loaded successfully.")
             except Exception as e:
                 self.logger.error(f"Failed to load configuration: {e}")
-                self.configuration = self.config_model()
-                self.save_config()
+                self._reset_to_defaults()
+                # Only replace a missing or empty file, keep invalid content for the user to fix
+                stat = self._stat_config()
+                if stat is None or stat[1] == 0:
+                    self.save_config()
+
+    def _reset_to_defaults(self):
+        """
+        Replace the configuration with the defaults of the configuration model.
+
+        The recorded stat and digest no longer describe the configuration in use, so they
+        are cleared and the next reload parses the file whatever it holds.
+        """
+        with self._mutation_lock:
+            self._swap_configuration(self.config_model())
+        self._last_stat = None
+        self._raw_digest = None
+
+    def _swap_configuration(self, configuration: Any):
+        """
+        Replace the configuration object.
+
+        Args:
+            configuration: The new configuration object.
+        """
+        with self._lock:
+            self._configuration = configuration
+            self._loaded = True
+
+    def _stat_config(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Get the modification time, size and inode of the configuration file.
+
+        Returns:
+            A tuple identifying the current file contents, or None if the file does not exist.
+        """
+        try:
+            stat = self.file_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
 
     def _from_dict(self, data: dict) -> Any:
         """
-        Merge a dictionary into a user-defined configuration object.
+        Merge a dictionary into a copy of the current configuration object.
+
+        The current configuration object is left untouched, so it can be read safely
+        while the merged copy is being built.
 
         Args:
             data: The dictionary containing configuration values.
@@ -124,37 +515,53 @@ class Sentinel(FileSystemEventHandler):
             if not isinstance(values, dict):
                 raise TypeError(f"Expected a dictionary for dataclass {cls}, got {type(values).__name__}")
 
-            field_types = {f.name: f.type for f in cls.__dataclass_fields__.values()}
             if instance is None:
                 instance = cls()
 
-            self.logger.debug(f"Merging into {cls.__name__} with instance: {instance} and values: {values}")
-
-            for key, field_type in field_types.items():
-                try:
-                    if key in values:
-                        value = values[key]
-                        if is_dataclass(field_type) and isinstance(value, dict):
-                            nested_instance = getattr(instance, key, None)
-                            setattr(instance, key, merge_instance(field_type, value, nested_instance))
-                        else:
-                            setattr(instance, key, value)
-                    elif not hasattr(instance, key) or getattr(instance, key) is None:
-                        default_value = getattr(cls(), key)
-                        setattr(instance, key, default_value)
-                except Exception as e:
-                    self.logger.error(f"Error merging key '{key}' in {cls.__name__}: {e}")
-                    raise
-
-            return instance
+            # Walk nested dataclasses with a worklist instead of recursing per level
+            root = instance
+            pending = [(cls, values, instance)]
+            while pending:
+                cls, values, instance = pending.pop()
+                self.logger.debug("Merging into %s with instance: %s and values: %s", cls.__name__, instance, values)
+
+                for key, field_type, is_nested, f in _field_specs(cls):
+                    try:
+                        if key in values:
+                            value = values[key]
+                            if is_nested and isinstance(value, dict):
+                                nested_instance = getattr(instance, key, None)
+                                if nested_instance is None:
+                                    nested_instance = field_type()
+                                    setattr(instance, key, nested_instance)
+                                pending.append((field_type, value, nested_instance))
+                            else:
+                                setattr(instance, key, value)
+                        elif not hasattr(instance, key) or getattr(instance, key) is None:
+                            default_value = _default_value(cls, f)
+                            setattr(instance, key, default_value)
+                    except Exception as e:
+                        self.logger.error(f"Error merging key '{key}' in {cls.__name__}: {e}")
+                        raise
+
+            return root
 
         if not is_dataclass(self.config_model):
             raise ValueError(f"{self.config_model} is not a valid dataclass.")
 
         try:
-            self.logger.debug(f"Deserializing with config_model: {self.config_model} and data: {data}")
-            instance = merge_instance(self.config_model, data, self.configuration)
-            self.logger.debug(f"Merged configuration: {instance}")
+            self.logger.debug("Deserializing with config_model: %s and data: %s", self.config_model, data)
+            current = copy.deepcopy(self._configuration)
+            merge = _compile_merge(self.config_model)
+            if merge is None:
+                instance = merge_instance(self.config_model, data, current)
+            else:
+                if not isinstance(data, dict):
+                    raise TypeError(
+                        f"Expected a dictionary for dataclass {self.config_model}, got {type(data).__name__}"
+                    )
+                instance = merge(current, data)
+            self.logger.debug("Merged configuration: %s", instance)
             return instance
         except Exception as e:
             self.logger.error(f"Failed to merge configuration: {e}")
@@ -164,29 +571,108 @@ class Sentinel(FileSystemEventHandler):
         """Save the default configuration to the file."""
         self.save_config()
 
-    def save_config(self):
+    def save_config(self, force: bool = False):
         """
         Save the current configuration object to the file.
 
+        The write is skipped when the configuration and the file are both unchanged since
+        the last save, and deferred until the outermost block exits inside batch().
+
+        Args:
+            force: Whether to write the file even if nothing changed since the last save.
+
         Raises:
             OSError: If directory creation or file saving fails due to permissions or other OS issues.
             Exception: If saving the configuration fails for other reasons.
         """
-        try:
-            try:
-                self.file_path.parent.mkdir(parents=True, exist_ok=True)
-            except OSError as e:
-                self.logger.error(f"Failed to create directory {self.file_path.parent}: {e}")
-                raise OSError(f"Failed to create configuration directory: {e}") from e
+        if self._save_suspended and not force:
+            self._save_dirty = True
+            return
 
+        try:
             data = self._to_dict(self.configuration)
-            self.logger.debug(f"Serialized configuration: {data}")
+            if not force and data == self._last_saved and self._stat_config() == self._last_stat:
+                self.logger.debug("Configuration unchanged since the last save, skipping write.")
+                return
+
+            if not self._parent_verified:
+                try:
+                    self.file_path.parent.mkdir(parents=True, exist_ok=True)
+                except OSError as e:
+                    self.logger.error(f"Failed to create directory {self.file_path.parent}: {e}")
+                    raise OSError(f"Failed to create configuration directory: {e}") from e
+                self._parent_verified = True
+
+            self.logger.debug("Serialized configuration: %s", data)
             self.handler.save(data)
+            self._raw_digest = None
+            self._last_saved = data
+            self._last_stat = self._stat_config()
             self.logger.info("Configuration saved successfully.")
+        except OSError as e:
+            # The directory may have been removed, create it again on the next save
+            self._parent_verified = False
+            self.logger.error(f"Failed to save configuration: {e}")
+            raise
         except Exception as e:
             self.logger.error(f"Failed to save configuration: {e}")
             raise
 
+    def flush(self):
+        """
+        Write the configuration to the file, even if it is unchanged since the last save.
+
+        Raises:
+            OSError: If directory creation or file saving fails due to permissions or other OS issues.
+            Exception: If saving the configuration fails for other reasons.
+        """
+        self.save_config(force=True)
+
+    @contextmanager
+    def batch(self) -> Iterator["Sentinel"]:
+        """
+        Defer saving the configuration until the block exits.
+
+        Calls to set() inside the block update the configuration in memory, and the file
+        is written once when the outermost batch() block exits. Blocks may be nested.
+
+        A batch covers the whole instance, not just the calling thread: the block holds the
+        mutation lock, so set() calls and reloads from other threads wait until it exits
+        instead of having their saves deferred or their values merged into the batch.
+
+        Yields:
+            Sentinel: This instance.
+
+        Raises:
+            OSError: If directory creation or file saving fails due to permissions or other OS issues.
+        """
+        # Load before taking the mutation lock, the initial load takes it after the reload lock
+        self._ensure_loaded()
+        with self._mutation_lock:
+            self._save_suspended += 1
+            try:
+                yield self
+            finally:
+                self._save_suspended -= 1
+                if not self._save_suspended and self._save_dirty:
+                    self._save_dirty = False
+                    self.save_config()
+
+    def update(self, values: Mapping[str, Any]):
+        """
+        Update several configuration values using dot notation and save the configuration once.
+
+        Args:
+            values: A mapping of configuration keys in dot notation to their new values.
+
+        Raises:
+            KeyError: If a key path is invalid or an intermediate key is None. Values set
+                before the invalid key are kept and saved.
+        """
+        with self.batch():
+            for key, value in values.items():
+                self.set(key, value)
+
     def to_dict(self) -> dict:
         """
         Convert the configuration object into a dictionary.
@@ -209,18 +695,10 @@ class Sentinel(FileSystemEventHandler):
         Raises:
             TypeError: If the object type is not supported.
         """
-        def recursive_asdict(o):
-            if is_dataclass(o):
-                return {k: recursive_asdict(v) for k, v in asdict(o).items()}
-            elif isinstance(o, list):
-                return [recursive_asdict(i) for i in o]
-            elif isinstance(o, dict):
-                return {k: recursive_asdict(v) for k, v in o.items()}
-            return '' if o is None else o
-
-        if is_dataclass(obj):
-            return recursive_asdict(obj)
-        raise TypeError(f"Unsupported configuration object type: {type(obj)}")
+        # None values are kept as-is, handlers for formats without null take care of them
+        if not is_dataclass(obj) or isinstance(obj, type):
+            raise TypeError(f"Unsupported configuration object type: {type(obj)}")
+        return _to_builtin(obj)
 
     def get(self, key: str, default=None) -> Any:
         """
@@ -233,14 +711,13 @@ class Sentinel(FileSystemEventHandler):
         Returns:
             The configuration value or the default value.
         """
-        keys = key.split(".")
-        value = self.configuration
-        for k in keys:
-            if hasattr(value, k):
-                value = getattr(value, k)
-            else:
-                return default
-        return value
+        getter = self._get_cache.get(key)
+        if getter is None:
+            getter = self._get_cache[key] = attrgetter(key)
+        try:
+            return getter(self.configuration)
+        except AttributeError:
+            return default
 
     def set(self, key: str, value: Any, inspect_caller=False):
         """
@@ -255,45 +732,91 @@ class Sentinel(FileSystemEventHandler):
             KeyError: If the key path is invalid or an intermediate key is None.
         """
         if inspect_caller:
-            stack = inspect.stack()
-            caller_frame = stack[1]
-            caller_module = inspect.getmodule(caller_frame[0])
-            caller_name = caller_frame.function
-            module_name = caller_module.__name__ if caller_module else "UnknownModule"
+            # Only the direct caller is needed, so avoid building the whole inspect.stack()
+            caller_frame = sys._getframe(1)
+            caller_name = caller_frame.f_code.co_name
+            module_name = caller_frame.f_globals.get("__name__", "UnknownModule")
 
             self.logger.warning(
                 f"Sentinel.set() called by {module_name}.{caller_name} "
                 f"trying to set {key} to {value}"
             )
 
-        keys = key.split(".")
-        config = self.configuration
+        accessor = self._set_cache.get(key)
+        if accessor is None:
+            parent_key, _, last_key = key.rpartition(".")
+            get_parent = attrgetter(parent_key) if parent_key else lambda config: config
+            accessor = self._set_cache[key] = (get_parent, last_key)
+        get_parent, last_key = accessor
 
-        for k in keys[:-1]:
-            if hasattr(config, k):
-                sub_config = getattr(config, k)
-                if sub_config is None:
-                    raise KeyError(f"Intermediate key '{k}' is None in path: {key}")
-                config = sub_config
+        # Load before taking the mutation lock, the initial load takes it after the reload lock
+        self._ensure_loaded()
+        with self._mutation_lock:
+            try:
+                config = get_parent(self.configuration)
+            except AttributeError:
+                config = None
+
+            if config is None:
+                # Walk the path step by step to report which key is invalid
+                keys = key.split(".")
+                config = self.configuration
+                for i, k in enumerate(keys[:-1]):
+                    if _has_field(config, k):
+                        sub_config = getattr(config, k)
+                        if sub_config is None:
+                            raise KeyError(f"Intermediate key '{k}' is None in path: {key}")
+                        config = sub_config
+                    else:
+                        full_key = ".".join(keys[:i + 1])
+                        raise KeyError(f"Invalid configuration key: {full_key}")
+
+            if _has_field(config, last_key):
+                setattr(config, last_key, value)
             else:
-                full_key = ".".join(keys[:keys.index(k) + 1])
-                raise KeyError(f"Invalid configuration key: {full_key}")
+                raise KeyError(f"Invalid configuration key: {key}")
 
-        last_key = keys[-1]
-        if hasattr(config, last_key):
-            setattr(config, last_key, value)
-        else:
-            raise KeyError(f"Invalid configuration key: {key}")
-
-        self.save_config()
+            self.save_config()
         self.logger.info(f"Updated configuration key '{key}' to '{value}'.")
 
     def stop_watching(self):
-        """Stop the file observer and join its thread."""
+        """
+        Stop the file observer, cancel any pending reload and join the observer thread.
+
+        A reload that is already running is waited for, and no reload starts afterwards.
+
+        The instance is released, so constructing a Sentinel for the same model and file
+        afterwards creates a new, watching instance.
+        """
         self.logger.info("Stopping file observer.")
+        with self._instances_lock:
+            if self._instances.get(self._registry_key) is self:
+                del self._instances[self._registry_key]
         self._observer.stop()
+        # Events still being dispatched may try to schedule a reload until the observer
+        # is joined, the flag makes them drop it
+        with self._timer_lock:
+            self._stopped = True
+            timer, self._reload_timer = self._reload_timer, None
+        if timer is not None:
+            timer.cancel()
+            if timer is not current_thread():
+                timer.join()
         self._observer.join()
 
+    def dispatch(self, event):
+        """
+        Dispatch file system events concerning the configuration file.
+
+        The observer watches the whole configuration directory, so events for other files
+        are dropped here, before the handler lookup and the per-event handlers.
+
+        Args:
+            event: The file system event to dispatch.
+        """
+        if event.src_path == self._watched_path or getattr(event, "dest_path", None) == self._watched_path:
+            super().dispatch(event)
+
     def on_modified(self, event):
         """
         Handle file modification events.
@@ -301,10 +824,57 @@ class Sentinel(FileSystemEventHandler):
         Args:
             event: The file system event that triggered this handler.
         """
-        if event.src_path == str(self.file_path):
-            self.logger.debug("Configuration file change detected, attempting reload...")
-            try:
-                self._load_config()
-                self.logger.info("Configuration successfully reloaded")
-            except Exception as e:
-                self.logger.error(f"Failed to reload configuration: {e}")
+        if event.src_path == self._watched_path:
+            self.logger.debug("Configuration file change detected, scheduling reload...")
+            self._schedule_reload()
+
+    def on_created(self, event):
+        """
+        Handle file creation events.
+
+        Args:
+            event: The file system event that triggered this handler.
+        """
+        if event.src_path == self._watched_path:
+            self.logger.debug("Configuration file created, scheduling reload...")
+            self._schedule_reload()
+
+    def on_moved(self, event):
+        """
+        Handle file move events.
+
+        Atomic saves write a temporary file and rename it over the configuration file,
+        which is reported as a move onto the configuration file.
+
+        Args:
+            event: The file system event that triggered this handler.
+        """
+        if event.dest_path == self._watched_path:
+            self.logger.debug("Configuration file replaced, scheduling reload...")
+            self._schedule_reload()
+
+    def _schedule_reload(self):
+        """
+        Schedule a reload of the configuration file.
+
+        Editors and tools like git emit bursts of events for a single change, so the
+        reload is debounced: each event restarts the timer, and the reload only runs once
+        no further events arrive for ``debounce_ms`` milliseconds. Nothing is scheduled
+        once stop_watching() was called.
+        """
+        with self._timer_lock:
+            if self._stopped:
+                return
+            if self._reload_timer is not None:
+                self._reload_timer.cancel()
+            self._reload_timer = Timer(self._debounce_delay, self._reload)
+            self._reload_timer.daemon = True
+            self._reload_timer.start()
+
+    def _reload(self):
+        """Reload the configuration after a file change, logging any failure."""
+        try:
+            self._load_config()
+            self.logger.info("Configuration successfully reloaded")
+        except Exception as e:
+            self.logger.error(f"Failed to reload configuration: {e}")
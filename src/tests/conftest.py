@@ -1,19 +1,185 @@
 """
 Custom pytest configuration module.
 
-This module contains pytest hooks and configuration settings for test execution.
-It handles tasks like generating coverage badges after test runs.
+This module contains pytest hooks and shared fixtures for test execution. It handles
+tasks like generating coverage badges after test runs. The configuration models used by
+the tests live in the ``models`` helper module.
 """
 
 # Standard library imports
 import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Tuple, Type
+
+# Third-party imports
+import pytest
+
+# Local imports
+from config_sentinel.handlers import ConfigHandler, JSONHandler
+from config_sentinel.sentinel import Sentinel
+from models import HANDLERS, AppConfig
+
+@pytest.fixture(autouse=True)
+def reset_sentinel(request: pytest.FixtureRequest) -> None:
+    """
+    Reset the Sentinel instances before each test that can use them.
+    
+    This fixture ensures each test starts with a clean Sentinel instance
+    by clearing the registered instances between tests. Tests in modules that
+    do not import Sentinel, such as the handler tests, are left alone.
+
+    Args:
+        request: Pytest request object for the test
+    """
+    if "Sentinel" in vars(request.module):
+        Sentinel._instances.clear()
+
+
+@pytest.fixture(scope="session")
+def default_app_dict() -> Dict[str, Any]:
+    """
+    Provide the default AppConfig as a dictionary, built once per test session.
+
+    Returns:
+        The default configuration values, as saved to a configuration file
+    """
+    return asdict(AppConfig())
+
+
+@pytest.fixture(scope="module")
+def cfg_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Provide a temporary directory for configuration files, shared by the tests of a module.
+
+    Tests name their files after themselves, so they stay isolated without a new
+    directory per test.
+
+    Args:
+        tmp_path_factory: Pytest factory for temporary directories
+
+    Returns:
+        Path to the shared temporary directory
+    """
+    return tmp_path_factory.mktemp("cfg")
+
+
+@pytest.fixture(params=list(HANDLERS))
+def sentinel_and_handler_lazy(request: pytest.FixtureRequest, cfg_dir: Path) \
+        -> Tuple[Type[ConfigHandler], Path]:
+    """
+    Provide a handler class and a missing configuration file, without creating a Sentinel.
+
+    Tests control when the first Sentinel is created and what the file holds at that
+    point.
+
+    Args:
+        request: Pytest request object containing the file format parameter
+        cfg_dir: Fixture providing the shared configuration directory
+
+    Returns:
+        Tuple containing:
+            - Handler class for the file format
+            - Path to the temporary config file, which does not exist
+    """
+    file_extension = request.param
+    return HANDLERS[file_extension], cfg_dir / f"{request.node.name}.{file_extension}"
+
+
+@pytest.fixture
+def sentinel_and_handler(sentinel_and_handler_lazy: Tuple[Type[ConfigHandler], Path]) \
+        -> Iterator[Tuple[Sentinel, object, Path]]:
+    """
+    Provide a Sentinel instance and handler for different file formats.
+
+    Creates a new Sentinel instance with appropriate handler for each supported
+    file format, starting from a missing configuration file. The Sentinel stops
+    watching once the test finishes.
+
+    Args:
+        sentinel_and_handler_lazy: Fixture providing the handler class and config file path
+
+    Yields:
+        Tuple containing:
+            - Sentinel instance configured for testing
+            - Handler instance for file operations
+            - Path to the temporary config file
+    """
+    handler_class, file_path = sentinel_and_handler_lazy
+    handler = handler_class(file_path)
+    sentinel = Sentinel(config_model=AppConfig, handler=handler)
+    yield sentinel, handler, file_path
+    sentinel.stop_watching()
+
+
+@pytest.fixture
+def sentinel_json(request: pytest.FixtureRequest, cfg_dir: Path) -> Iterator[Sentinel]:
+    """
+    Provide a Sentinel backed by a JSON file, for tests independent of the file format.
+
+    Args:
+        request: Pytest request object for the test
+        cfg_dir: Fixture providing the shared configuration directory
+
+    Yields:
+        Sentinel instance configured for testing
+    """
+    file_path = cfg_dir / f"{request.node.name}.json"
+    sentinel = Sentinel(config_model=AppConfig, handler=JSONHandler(file_path))
+    yield sentinel
+    sentinel.stop_watching()
+
+
+@pytest.fixture
+def cfg_file(request: pytest.FixtureRequest, cfg_dir: Path) -> Callable[[str], Path]:
+    """
+    Provide paths for configuration files named after the test, in the shared directory.
+
+    Args:
+        request: Pytest request object for the test
+        cfg_dir: Fixture providing the shared configuration directory
+
+    Returns:
+        A function mapping a file name to its path, unique to the test
+    """
+    return lambda name: cfg_dir / f"{request.node.name}-{name}"
+
+
+@pytest.fixture
+def make_sentinel() -> Iterator[Callable[..., Sentinel]]:
+    """
+    Provide a factory for Sentinels that do not watch their configuration file.
+
+    Sentinels are stopped as soon as they are created, unless ``watching`` is set, and
+    every Sentinel created is stopped once the test finishes, so a failing assertion
+    never leaks a running observer.
+
+    Yields:
+        A function creating a Sentinel from a file path, with optional ``config_model``,
+        ``handler_class`` and ``watching`` arguments
+    """
+    sentinels = []
+
+    def create(file_path: Path, config_model: Type[Any] = AppConfig,
+               handler_class: Type[ConfigHandler] = JSONHandler, watching: bool = False) -> Sentinel:
+        sentinel = Sentinel(config_model=config_model, handler=handler_class(file_path))
+        sentinels.append(sentinel)
+        if not watching:
+            sentinel.stop_watching()
+        return sentinel
+
+    yield create
+    for sentinel in sentinels:
+        sentinel.stop_watching()
 
 
 def pytest_sessionfinish(session, exitstatus):
     """
     Execute commands after the pytest session finishes.
     
-    This hook runs after all tests complete to generate a coverage badge.
+    This hook runs after all tests complete to generate a coverage badge when the
+    ``GEN_COVERAGE_BADGE`` environment variable is set. The badge is generated in
+    process, without spawning a shell and a new interpreter.
     
     Args:
         session: The pytest session object containing test execution info
@@ -22,4 +188,10 @@ def pytest_sessionfinish(session, exitstatus):
     Returns:
         None
     """
-    os.system("uv run coverage-badge -f -o assets/coverage.svg")
+    if not os.environ.get("GEN_COVERAGE_BADGE"):
+        return
+
+    # Third-party imports
+    from coverage_badge.__main__ import main as coverage_badge
+
+    coverage_badge(["-f", "-o", "assets/coverage.svg"])
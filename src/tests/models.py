@@ -0,0 +1,72 @@
+"""
+Configuration models and handlers shared by the test modules.
+"""
+
+# Standard library imports
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+# Local imports
+from config_sentinel.handlers import JSONHandler, TOMLHandler, YAMLHandler
+
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+# Handler class for each file format under test
+HANDLERS = {"json": JSONHandler, "toml": TOMLHandler, "yaml": YAMLHandler}
+
+
+@dataclass
+class UserConfig:
+    """
+    Configuration model for user-related settings.
+    
+    Attributes:
+        username (Optional[str]): The username for authentication, defaults to None
+        password (Optional[str]): The password for authentication, defaults to None
+    """
+    username: Optional[str] = None
+    password: Optional[str] = None
+
+
+@dataclass
+class AppConfig:
+    """
+    Configuration model for application settings.
+    
+    Attributes:
+        app_name (str): The name of the application, defaults to "MyApp"
+        version (str): The version of the application, defaults to "1.0.0"
+        debug (bool): Debug mode flag, defaults to False
+        user (UserConfig): Nested user configuration, defaults to empty UserConfig
+    """
+    app_name: str = "MyApp"
+    version: str = "1.0.0"
+    debug: bool = False
+    user: UserConfig = field(default_factory=UserConfig)
+
+
+@dataclass
+class AnnotatedConfig:
+    """
+    Configuration model declaring its nested type with a string annotation.
+
+    Attributes:
+        app_name (str): The name of the application, defaults to "MyApp"
+        user (UserConfig): Nested user configuration, defaults to empty UserConfig
+    """
+    app_name: "str" = "MyApp"
+    user: "UserConfig" = field(default_factory=UserConfig)
+
+
+@dataclass
+class PartlyAnnotatedConfig:
+    """
+    Configuration model with a string annotation naming a type only imported for type checkers.
+
+    Attributes:
+        user (UserConfig): Nested user configuration, defaults to empty UserConfig
+        threshold (Optional[Decimal]): A value annotated with an unresolvable name, defaults to None
+    """
+    user: "UserConfig" = field(default_factory=UserConfig)
+    threshold: "Optional[Decimal]" = None
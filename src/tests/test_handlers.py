@@ -14,7 +14,9 @@ while maintaining isolation and independence from other tests.
 """
 
 # Standard library imports
+import errno
 import os
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Dict, Tuple, Type, Union
 
@@ -27,10 +29,11 @@ from config_sentinel.handlers import (
     TOMLHandler,
     YAMLHandler
 )
+from models import HANDLERS, UserConfig
 
 
-@pytest.fixture(params=["json", "toml", "yaml"])
-def handler_and_file(request: pytest.FixtureRequest, tmp_path: Path) \
+@pytest.fixture(params=list(HANDLERS))
+def handler_and_file(request: pytest.FixtureRequest, cfg_dir: Path) \
     -> Tuple[Union[JSONHandler, TOMLHandler, YAMLHandler], Path]:
     """
     Fixture providing handler class and temporary file path for different formats.
@@ -40,14 +43,14 @@ def handler_and_file(request: pytest.FixtureRequest, tmp_path: Path) \
     
     Args:
         request: Pytest request object containing the format parameter
-        tmp_path: Temporary directory path provided by pytest
+        cfg_dir: Temporary directory shared by the tests of this module
     
     Returns:
         tuple: A tuple containing (handler instance, file path)
     """
     file_extension = request.param
-    file_path = tmp_path / f"config.{file_extension}"
-    handler_class = {"json": JSONHandler, "toml": TOMLHandler, "yaml": YAMLHandler}[file_extension]
+    file_path = cfg_dir / f"{request.node.name}.{file_extension}"
+    handler_class = HANDLERS[file_extension]
     return handler_class(file_path), file_path
 
 
@@ -190,14 +193,16 @@ def test_handler_nested_data_structure(
     assert loaded_data == nested_data, "Loaded nested data should match saved nested data."
 
 
+@pytest.mark.skipif(os.name == "nt" or os.geteuid() == 0,
+                    reason="Requires POSIX permissions, which are not enforced for root")
 def test_handler_read_only_file(
         handler_and_file: Tuple[Union[JSONHandler, TOMLHandler, YAMLHandler], Path]) -> None:
     """
-    Test handling of read-only files.
+    Test handling of read-only locations.
     
     Verifies that:
-    - Read-only files raise appropriate exceptions
-    - Permission errors are handled correctly
+    - A writable file in a write-protected directory is saved in place
+    - Saving a read-only file raises an appropriate exception
     - System permissions are respected
     
     Args:
@@ -206,15 +211,296 @@ def test_handler_read_only_file(
     handler, file_path = handler_and_file
 
     # Save valid data
-    data = {"key": "value"}
+    handler.save({"key": "value"})
+
+    # Write-protect the directory, so no temporary file can be created next to the file
+    os.chmod(file_path.parent, 0o555)
+    try:
+        data = {"key": "in_place"}
+        handler.save(data)
+        assert handler.load() == data
+
+        # Make the file read-only
+        os.chmod(file_path, 0o444)
+        with pytest.raises(PermissionError, match="Permission denied"):
+            handler.save({"new_key": "new_value"})
+    finally:
+        # Revert permissions to avoid test issues
+        os.chmod(file_path.parent, 0o755)
+        os.chmod(file_path, 0o644)
+
+    assert handler.load() == data
+
+
+def test_handler_large_file(
+        handler_and_file: Tuple[Union[JSONHandler, TOMLHandler, YAMLHandler], Path]) -> None:
+    """
+    Test saving and loading a configuration larger than the memory-map threshold.
+
+    Verifies that:
+    - Large files are parsed correctly
+    - Data read through a memory map matches the saved data
+
+    Args:
+        handler_and_file: Fixture providing handler and file path
+    """
+    handler, file_path = handler_and_file
+
+    # Data large enough to exceed the memory-map threshold
+    large_data = {f"section_{i}": {"name": f"value_{i}", "enabled": i % 2 == 0} for i in range(1000)}
+
+    # Save and reload data
+    handler.save(large_data)
+    assert file_path.stat().st_size >= 16 * 1024
+    loaded_data = handler.load()
+    assert loaded_data == large_data, "Loaded large data should match saved data."
+
+
+@pytest.mark.parametrize("size", [1, 1000])
+def test_handler_load_if_changed(
+        handler_and_file: Tuple[Union[JSONHandler, TOMLHandler, YAMLHandler], Path], size: int) -> None:
+    """
+    Test loading a configuration only when its contents have changed.
+
+    Verifies that:
+    - The first load returns the data and a digest of the contents
+    - Passing that digest back skips parsing unchanged contents
+    - Changed contents are parsed again, for small and memory-mapped files
+
+    Args:
+        handler_and_file: Fixture providing handler and file path
+        size: Number of sections in the saved data
+    """
+    handler, file_path = handler_and_file
+
+    data = {f"section_{i}": {"name": f"value_{i}"} for i in range(size)}
+    handler.save(data)
+
+    loaded, digest = handler.load_if_changed(None)
+    assert loaded == data
+    assert handler.load_if_changed(digest) == (None, digest)
+
+    data["section_0"]["name"] = "changed"
     handler.save(data)
+    loaded, new_digest = handler.load_if_changed(digest)
+    assert loaded == data
+    assert new_digest != digest
+
+
+def test_handler_load_returns_independent_copies(
+        handler_and_file: Tuple[Union[JSONHandler, TOMLHandler, YAMLHandler], Path], monkeypatch) -> None:
+    """
+    Test that repeated loads of an unchanged file return independent data.
+
+    Verifies that:
+    - Mutating loaded data does not affect later loads
+    - Handlers caching parsed data parse contents once for all handlers of the file
+    - Saving new data is reflected by the next load
+
+    Args:
+        handler_and_file: Fixture providing handler and file path
+        monkeypatch: Pytest fixture for patching attributes
+    """
+    handler, file_path = handler_and_file
+
+    handler.save({"app_name": "CachedApp", "settings": {"theme": "dark"}})
+
+    first, _ = handler.load_if_changed(None)
+    first["settings"]["theme"] = "light"
+
+    other = type(handler)(file_path)
+    parses = []
+    original_parse = other._parse
+    monkeypatch.setattr(other, "_parse", lambda content: parses.append(1) or original_parse(content))
+    assert other.load_if_changed(None)[0] == {"app_name": "CachedApp", "settings": {"theme": "dark"}}
+    assert len(parses) == (0 if other._cache_parsed else 1)
+
+    handler.save({"app_name": "CachedApp", "settings": {"theme": "blue"}})
+    assert other.load_if_changed(None)[0]["settings"]["theme"] == "blue"
+    assert handler.load()["settings"]["theme"] == "blue"
+
+
+def test_handler_atomic_save(
+        handler_and_file: Tuple[Union[JSONHandler, TOMLHandler, YAMLHandler], Path]) -> None:
+    """
+    Test that saving replaces the file atomically.
+
+    Verifies that:
+    - No temporary file is left behind
+    - A new file gets the default permissions
+    - The permissions of an existing file are preserved
+
+    Args:
+        handler_and_file: Fixture providing handler and file path
+    """
+    handler, file_path = handler_and_file
+
+    umask = os.umask(0)
+    os.umask(umask)
+
+    handler.save({"key": "value"})
+    assert file_path.stat().st_mode & 0o777 == 0o666 & ~umask
+
+    os.chmod(file_path, 0o600)
+    handler.save({"key": "new_value"})
+
+    assert handler.load() == {"key": "new_value"}
+    assert not list(file_path.parent.glob(f".{file_path.name}.*.tmp"))
+    assert file_path.stat().st_mode & 0o777 == 0o600
+
+
+def test_handler_save_through_symlink(
+        handler_and_file: Tuple[Union[JSONHandler, TOMLHandler, YAMLHandler], Path]) -> None:
+    """
+    Test that saving a symlinked configuration file updates the link target.
 
-    # Make the file read-only
-    os.chmod(file_path, 0o444)
+    Verifies that:
+    - The symbolic link is kept
+    - The file it points to receives the new content
+
+    Args:
+        handler_and_file: Fixture providing handler and file path
+    """
+    handler, file_path = handler_and_file
+    target = file_path.with_name(f"target-{file_path.name}")
+    type(handler)(target).save({"key": "value"})
+    file_path.symlink_to(target)
+
+    handler.save({"key": "new_value"})
+
+    assert file_path.is_symlink()
+    assert type(handler)(target).load() == {"key": "new_value"}
+
+
+@pytest.mark.parametrize("handler_class", list(HANDLERS.values()))
+def test_handler_compact_output(handler_class: type, tmp_path: Path) -> None:
+    """
+    Test saving and loading configuration with compact output.
+
+    Verifies that:
+    - Compact output is loaded back unchanged
+    - Compact output is not larger than pretty output
+
+    Args:
+        handler_class: The handler class under test
+        tmp_path: Temporary directory path provided by pytest
+    """
+    data = {
+        "app_name": "CompactApp",
+        "numbers": [1, 2, 3],
+        "settings": {"theme": "dark", "features": {"logging": True}}
+    }
+
+    pretty_handler = handler_class(tmp_path / "pretty.cfg")
+    compact_handler = handler_class(tmp_path / "compact.cfg", pretty=False)
+    pretty_handler.save(data)
+    compact_handler.save(data)
+
+    assert compact_handler.load() == data
+    assert compact_handler.file_path.stat().st_size <= pretty_handler.file_path.stat().st_size
+
+
+@pytest.mark.parametrize("content", ["", "\n  \n", "# comment only\n", "  # indented comment\n\n", "null\n"])
+def test_yaml_handler_empty_document(content: str, tmp_path: Path) -> None:
+    """
+    Test loading YAML files that hold no data.
+
+    Verifies that:
+    - Empty, whitespace-only and comment-only files load as an empty dictionary
+    - An explicit null document loads as an empty dictionary
+
+    Args:
+        content: The YAML file content
+        tmp_path: Temporary directory path provided by pytest
+    """
+    file_path = tmp_path / "config.yaml"
+    file_path.write_text(content)
+
+    assert YAMLHandler(file_path).load() == {}
+
+
+def test_handler_save_in_place_fallback(
+        handler_and_file: Tuple[Union[JSONHandler, TOMLHandler, YAMLHandler], Path], monkeypatch) -> None:
+    """
+    Test that saving falls back to writing in place when no temporary file can be created.
+
+    Verifies that:
+    - The file is updated without a temporary file
+    - The file keeps its inode, so it was not replaced
+
+    Args:
+        handler_and_file: Fixture providing handler and file path
+        monkeypatch: Pytest fixture for patching attributes
+    """
+    handler, file_path = handler_and_file
+    handler.save({"key": "value"})
+    inode = file_path.stat().st_ino
+
+    original_open = os.open
 
-    # Attempt to save and expect a failure
-    with pytest.raises(PermissionError, match="Permission denied"):
-        handler.save({"new_key": "new_value"})
+    def deny(path, *args, **kwargs):
+        if str(path).endswith(".tmp"):
+            raise PermissionError(errno.EACCES, "Permission denied")
+        return original_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "open", deny)
+    handler.save({"key": "in_place"})
+
+    assert handler.load() == {"key": "in_place"}
+    assert file_path.stat().st_ino == inode
+
+    # Data that cannot be serialized leaves the file untouched
+    with pytest.raises(Exception):
+        handler.save({"key": object()})
+    assert handler.load() == {"key": "in_place"}
+
+
+def test_handler_save_keeps_file_when_temporary_file_fails(
+        handler_and_file: Tuple[Union[JSONHandler, TOMLHandler, YAMLHandler], Path], monkeypatch) -> None:
+    """
+    Test that errors other than denied permissions do not fall back to writing in place.
+
+    Verifies that:
+    - The error is raised
+    - The existing file keeps its content
 
-    # Revert permissions to avoid test issues
-    os.chmod(file_path, 0o666)
+    Args:
+        handler_and_file: Fixture providing handler and file path
+        monkeypatch: Pytest fixture for patching attributes
+    """
+    handler, file_path = handler_and_file
+    handler.save({"key": "value"})
+    original_open = os.open
+
+    def no_space(path, *args, **kwargs):
+        if str(path).endswith(".tmp"):
+            raise OSError(errno.ENOSPC, "No space left on device")
+        return original_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "open", no_space)
+    with pytest.raises(OSError):
+        handler.save({"key": "new_value"})
+
+    assert handler.load() == {"key": "value"}
+
+
+def test_json_handler_saves_stdlib_compatible_data(tmp_path: Path) -> None:
+    """
+    Test that the JSON handler saves the same data with and without orjson.
+
+    Verifies that:
+    - Non-string keys are written as strings
+    - Integers beyond 64 bits are written
+    - Dates and dataclasses are rejected and leave the file untouched
+
+    Args:
+        tmp_path: Temporary directory path provided by pytest
+    """
+    handler = JSONHandler(tmp_path / "config.json")
+    handler.save({1: "x", "big": 2 ** 70})
+    assert handler.load() == {"1": "x", "big": 2 ** 70}
+
+    for value in (date(2024, 1, 1), datetime(2024, 1, 1, 12), UserConfig()):
+        with pytest.raises(TypeError):
+            handler.save({"value": value})
+    assert handler.load() == {"1": "x", "big": 2 ** 70}
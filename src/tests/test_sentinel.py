@@ -4,7 +4,7 @@ This module contains comprehensive test cases for the Sentinel class, which prov
 management functionality with support for different file formats (JSON, TOML, YAML).
 
 The test suite covers:
-- Initialization and singleton pattern behavior
+- Initialization and per-file instance behavior
 - File handling and persistence
 - Configuration updates and validation
 - Nested configuration access
@@ -18,111 +18,55 @@ while maintaining isolation and independence from other tests.
 """
 
 # Standard library imports
+import json
 import logging
-from dataclasses import dataclass, field
+import os
+import time
 from pathlib import Path
-from typing import Optional, Tuple
+from threading import Thread
+from typing import Any, Callable, Dict, Tuple, Type
 
 # Third-party imports
 import pytest
+from watchdog.events import FileCreatedEvent, FileModifiedEvent, FileMovedEvent
+from watchdog.observers import Observer
 
 # Local imports
+from config_sentinel.handlers import ConfigHandler
 from config_sentinel.handlers.json_handler import JSONHandler
-from config_sentinel.handlers.toml_handler import TOMLHandler
 from config_sentinel.handlers.yaml_handler import YAMLHandler
 from config_sentinel.sentinel import Sentinel
+from models import AnnotatedConfig, AppConfig, PartlyAnnotatedConfig, UserConfig
 
 
-@dataclass
-class UserConfig:
-    """
-    Configuration model for user-related settings.
-    
-    Attributes:
-        username (Optional[str]): The username for authentication, defaults to None
-        password (Optional[str]): The password for authentication, defaults to None
-    """
-    username: Optional[str] = None
-    password: Optional[str] = None
-
-
-@dataclass
-class AppConfig:
-    """
-    Configuration model for application settings.
-    
-    Attributes:
-        app_name (str): The name of the application, defaults to "MyApp"
-        version (str): The version of the application, defaults to "1.0.0"
-        debug (bool): Debug mode flag, defaults to False
-        user (UserConfig): Nested user configuration, defaults to empty UserConfig
-    """
-    app_name: str = "MyApp"
-    version: str = "1.0.0"
-    debug: bool = False
-    user: UserConfig = field(default_factory=UserConfig)
-
-
-@pytest.fixture(autouse=True)
-def reset_sentinel() -> None:
-    """
-    Reset the Sentinel singleton before each test.
-    
-    This fixture ensures each test starts with a clean Sentinel instance
-    by clearing the singleton instance between tests.
-    """
-    Sentinel._instance = None
-
-
-@pytest.fixture(params=["json", "toml", "yaml"])
-def sentinel_and_handler(request, tmp_path) -> Tuple[Sentinel, object, Path]:
-    """
-    Provide a Sentinel instance and handler for different file formats.
-
-    Creates a new Sentinel instance with appropriate handler for each supported
-    file format, using a temporary directory for test files.
-
-    Args:
-        request: Pytest request object containing the file format parameter
-        tmp_path: Temporary directory path for test files
-
-    Returns:
-        Tuple containing:
-            - Sentinel instance configured for testing
-            - Handler instance for file operations
-            - Path to the temporary config file
-    """
-    file_extension = request.param
-    file_path = tmp_path / f"config.{file_extension}"
-    handler_class = {"json": JSONHandler, "toml": TOMLHandler, "yaml": YAMLHandler}[file_extension]
-    handler = handler_class(file_path)
-    sentinel = Sentinel(config_model=AppConfig, handler=handler)
-    return sentinel, handler, file_path
-
-
-def test_sentinel_initialization(sentinel_and_handler: Tuple[Sentinel, object, Path]) -> None:
+def test_sentinel_initialization(sentinel_and_handler: Tuple[Sentinel, object, Path],
+                                 default_app_dict: Dict[str, Any]) -> None:
     """
     Test proper initialization of Sentinel with default values.
     
     Verifies that:
     - Default configuration values are set correctly
     - Configuration file is created automatically
-    - Singleton pattern is maintained
+    - Constructing again for the same model and file returns the same instance
     
     Args:
         sentinel_and_handler: Fixture providing test components
+        default_app_dict: Fixture providing the default configuration as a dictionary
     """
-    sentinel, _, file_path = sentinel_and_handler
+    sentinel, handler, file_path = sentinel_and_handler
+
+    assert Sentinel(config_model=AppConfig, handler=handler) is sentinel
 
     # Verify default values on first run
-    assert sentinel.get("app_name") == "MyApp"
-    assert sentinel.get("user.username") is None
+    assert sentinel.to_dict() == default_app_dict
 
     # Verify file creation
     assert file_path.exists(), "Config file should be created with default values."
+    assert handler.load() == default_app_dict
 
 
-def test_sentinel_missing_config_file(sentinel_and_handler: Tuple[Sentinel, object, Path]) -> None:
+def test_sentinel_missing_config_file(sentinel_and_handler_lazy: Tuple[Type[ConfigHandler], Path],
+                                      default_app_dict: Dict[str, Any]) -> None:
     """
     Test Sentinel behavior when config file is missing.
     
@@ -132,27 +76,28 @@ def test_sentinel_missing_config_file(sentinel_and_handler: Tuple[Sentinel, obje
     - New configuration file is created automatically
     
     Args:
-        sentinel_and_handler: Fixture providing test components
+        sentinel_and_handler_lazy: Fixture providing the handler class and a missing config file
+        default_app_dict: Fixture providing the default configuration as a dictionary
     """
-    sentinel, handler, file_path = sentinel_and_handler
-
-    if file_path.exists():
-        file_path.unlink()
+    handler_class, file_path = sentinel_and_handler_lazy
+    assert not file_path.exists()
 
+    handler = handler_class(file_path)
     sentinel = Sentinel(config_model=AppConfig, handler=handler)
+    sentinel.stop_watching()
 
     # Force config save
     sentinel.save_config()
 
     # Verify defaults
-    assert sentinel.get("app_name") == "MyApp"
-    assert sentinel.get("user.username") is None
+    assert sentinel.to_dict() == default_app_dict
 
     # Verify file creation
     assert file_path.exists()
+    assert handler.load() == default_app_dict
 
 
-def test_sentinel_set_and_get(sentinel_and_handler: Tuple[Sentinel, object, Path]) -> None:
+def test_sentinel_set_and_get(sentinel_json: Sentinel) -> None:
     """
     Test setting and getting configuration values.
     
@@ -162,9 +107,9 @@ def test_sentinel_set_and_get(sentinel_and_handler: Tuple[Sentinel, object, Path
     - Both simple and nested values work properly
     
     Args:
-        sentinel_and_handler: Fixture providing test components
+        sentinel_json: Fixture providing a JSON-backed Sentinel
     """
-    sentinel, _, _ = sentinel_and_handler
+    sentinel = sentinel_json
 
     # Update configuration
     sentinel.set("user.username", "admin_user")
@@ -175,7 +120,7 @@ def test_sentinel_set_and_get(sentinel_and_handler: Tuple[Sentinel, object, Path
     assert sentinel.get("debug") is True
 
 
-def test_sentinel_to_dict(sentinel_and_handler: Tuple[Sentinel, object, Path]) -> None:
+def test_sentinel_to_dict(sentinel_json: Sentinel) -> None:
     """
     Test conversion of configuration to dictionary format.
     
@@ -185,9 +130,9 @@ def test_sentinel_to_dict(sentinel_and_handler: Tuple[Sentinel, object, Path]) -
     - All values are correctly represented
     
     Args:
-        sentinel_and_handler: Fixture providing test components
+        sentinel_json: Fixture providing a JSON-backed Sentinel
     """
-    sentinel, _, _ = sentinel_and_handler
+    sentinel = sentinel_json
 
     # Update configuration
     sentinel.set("user.password", "new_password")
@@ -198,7 +143,7 @@ def test_sentinel_to_dict(sentinel_and_handler: Tuple[Sentinel, object, Path]) -
     assert config_dict["app_name"] == "MyApp"
 
 
-def test_sentinel_nested_update(sentinel_and_handler: Tuple[Sentinel, object, Path]) -> None:
+def test_sentinel_nested_update(sentinel_json: Sentinel) -> None:
     """
     Test updating nested configuration values.
     
@@ -208,20 +153,20 @@ def test_sentinel_nested_update(sentinel_and_handler: Tuple[Sentinel, object, Pa
     - Nested values can be retrieved correctly
     
     Args:
-        sentinel_and_handler: Fixture providing test components
+        sentinel_json: Fixture providing a JSON-backed Sentinel
     """
-    sentinel, _, _ = sentinel_and_handler
+    sentinel = sentinel_json
 
     # Update nested configuration
     sentinel.set("user.username", "nested_user")
     sentinel.set("user.password", "nested_pass")
 
     # Verify nested updates
-    assert sentinel.get("user.username") == "nested_user"
-    assert sentinel.get("user.password") == "nested_pass"
+    snapshot = sentinel.to_dict()
+    assert snapshot["user"] == {"username": "nested_user", "password": "nested_pass"}
 
 
-def test_sentinel_invalid_key(sentinel_and_handler: Tuple[Sentinel, object, Path]) -> None:
+def test_sentinel_invalid_key(sentinel_json: Sentinel) -> None:
     """
     Test handling of invalid configuration keys.
     
@@ -231,14 +176,18 @@ def test_sentinel_invalid_key(sentinel_and_handler: Tuple[Sentinel, object, Path
     - None value handling is proper
     
     Args:
-        sentinel_and_handler: Fixture providing test components
+        sentinel_json: Fixture providing a JSON-backed Sentinel
     """
-    sentinel, _, _ = sentinel_and_handler
+    sentinel = sentinel_json
 
     # Test invalid nested key
     with pytest.raises(KeyError, match=r"Invalid configuration key: non"):
         sentinel.set("non.existent.key", "value")
 
+    # Test that a repeated segment is reported at its own position
+    with pytest.raises(KeyError, match=r"Invalid configuration key: user\.user'"):
+        sentinel.set("user.user.name", "value")
+
     # Set an intermediate key to None
     sentinel.set("user", None)
 
@@ -251,7 +200,7 @@ def test_sentinel_invalid_key(sentinel_and_handler: Tuple[Sentinel, object, Path
         sentinel.set("user.invalid_field", "value")
 
 
-def test_sentinel_inspect_caller(sentinel_and_handler: Tuple[Sentinel, object, Path], caplog) -> None:
+def test_sentinel_inspect_caller(sentinel_json: Sentinel, caplog) -> None:
     """
     Test caller inspection functionality.
     
@@ -261,16 +210,17 @@ def test_sentinel_inspect_caller(sentinel_and_handler: Tuple[Sentinel, object, P
     - Logging level is correct
     
     Args:
-        sentinel_and_handler: Fixture providing test components
+        sentinel_json: Fixture providing a JSON-backed Sentinel
         caplog: Pytest fixture for capturing log output
     """
-    sentinel, _, _ = sentinel_and_handler
+    sentinel = sentinel_json
 
     with caplog.at_level(logging.WARNING):
         sentinel.set("app_name", "CallerTestApp", inspect_caller=True)
 
     # Verify log output
     assert "Sentinel.set() called by" in caplog.text
+    assert "test_sentinel_inspect_caller trying to set app_name to CallerTestApp" in caplog.text
 
 
 def test_sentinel_merge_preserves_existing_values(sentinel_and_handler: Tuple[Sentinel, object, Path]) -> None:
@@ -306,13 +256,14 @@ def test_sentinel_merge_preserves_existing_values(sentinel_and_handler: Tuple[Se
     sentinel._load_config()
 
     # Verify the merge behavior
-    assert sentinel.get("app_name") == "UpdatedApp"  # Updated
-    assert sentinel.get("user.username") == "existing_user"  # Preserved
-    assert sentinel.get("user.password") == "new_password"  # Added
-    assert sentinel.get("debug") is True  # Added
+    snapshot = sentinel.to_dict()
+    assert snapshot["app_name"] == "UpdatedApp"  # Updated
+    assert snapshot["user"]["username"] == "existing_user"  # Preserved
+    assert snapshot["user"]["password"] == "new_password"  # Added
+    assert snapshot["debug"] is True  # Added
 
 
-def test_from_dict_invalid_input(sentinel_and_handler: Tuple[Sentinel, object, Path]) -> None:
+def test_from_dict_invalid_input(sentinel_json: Sentinel) -> None:
     """
     Test handling of invalid input in from_dict method.
     
@@ -322,9 +273,9 @@ def test_from_dict_invalid_input(sentinel_and_handler: Tuple[Sentinel, object, P
     - Error messages are descriptive
     
     Args:
-        sentinel_and_handler: Fixture providing test components
+        sentinel_json: Fixture providing a JSON-backed Sentinel
     """
-    sentinel, _, _ = sentinel_and_handler
+    sentinel = sentinel_json
 
     # Invalid type (non-dict) passed to _from_dict
     with pytest.raises(TypeError, match="Expected a dictionary for dataclass"):
@@ -336,7 +287,7 @@ def test_from_dict_invalid_input(sentinel_and_handler: Tuple[Sentinel, object, P
         sentinel._from_dict({})
 
 
-def test_set_invalid_key_handling(sentinel_and_handler: Tuple[Sentinel, object, Path]) -> None:
+def test_set_invalid_key_handling(sentinel_json: Sentinel) -> None:
     """
     Test handling of invalid keys in set method.
     
@@ -346,9 +297,9 @@ def test_set_invalid_key_handling(sentinel_and_handler: Tuple[Sentinel, object,
     - None value handling is correct
     
     Args:
-        sentinel_and_handler: Fixture providing test components
+        sentinel_json: Fixture providing a JSON-backed Sentinel
     """
-    sentinel, _, _ = sentinel_and_handler
+    sentinel = sentinel_json
 
     # Test invalid key
     with pytest.raises(KeyError, match=r"Invalid configuration key: non"):
@@ -360,7 +311,7 @@ def test_set_invalid_key_handling(sentinel_and_handler: Tuple[Sentinel, object,
         sentinel.set("user.username", "value")
 
 
-def test_stop_watching(sentinel_and_handler: Tuple[Sentinel, object, Path], caplog) -> None:
+def test_stop_watching(sentinel_json: Sentinel, caplog) -> None:
     """
     Test stopping the file watcher functionality.
     
@@ -370,10 +321,10 @@ def test_stop_watching(sentinel_and_handler: Tuple[Sentinel, object, Path], capl
     - No exceptions are raised
     
     Args:
-        sentinel_and_handler: Fixture providing test components
+        sentinel_json: Fixture providing a JSON-backed Sentinel
         caplog: Pytest fixture for capturing log output
     """
-    sentinel, _, _ = sentinel_and_handler
+    sentinel = sentinel_json
 
     with caplog.at_level(logging.INFO):
         # Ensure no exceptions are raised when stopping the observer
@@ -381,3 +332,556 @@ def test_stop_watching(sentinel_and_handler: Tuple[Sentinel, object, Path], capl
 
     # Verify log output
     assert "Stopping file observer." in caplog.text
+
+
+def test_sentinel_skips_unchanged_reload(sentinel_and_handler: Tuple[Sentinel, object, Path],
+                                         monkeypatch) -> None:
+    """
+    Test that reloading an unchanged configuration file skips parsing.
+
+    Verifies that:
+    - An unchanged file is not parsed again
+    - A modified file is parsed on the next reload
+    - A file rewritten with the same contents is not parsed again
+
+    Args:
+        sentinel_and_handler: Fixture providing test components
+        monkeypatch: Pytest fixture for patching attributes
+    """
+    sentinel, handler, file_path = sentinel_and_handler
+    sentinel.stop_watching()
+    sentinel.to_dict()  # Trigger the initial load
+
+    loads = []
+    original_parse = handler._parse
+    monkeypatch.setattr(handler, "_parse", lambda content: loads.append(1) or original_parse(content))
+
+    # The file has not changed since Sentinel saved it
+    sentinel._load_config()
+    assert not loads
+
+    # Modify the config file directly to simulate an external update
+    handler.save({"app_name": "ExternalApp"})
+    sentinel._load_config()
+    assert len(loads) == 1
+    assert sentinel.get("app_name") == "ExternalApp"
+
+    # Rewrite the same contents, which changes the file's stat but not its data
+    file_path.write_bytes(file_path.read_bytes())
+    os.utime(file_path, ns=(0, 0))
+    sentinel._load_config()
+    assert len(loads) == 1
+    assert sentinel.get("app_name") == "ExternalApp"
+
+
+def test_sentinel_json_preserves_null(cfg_file: Callable[[str], Path], make_sentinel: Callable[..., Sentinel]) -> None:
+    """
+    Test that None values are written to JSON as null.
+
+    Verifies that:
+    - None values are not converted to empty strings for formats supporting null
+    - None values survive a reload
+
+    Args:
+        cfg_file: Fixture providing paths for the test's configuration files
+        make_sentinel: Fixture creating Sentinels that are stopped after the test
+    """
+    file_path = cfg_file("config.json")
+    sentinel = make_sentinel(file_path)
+    sentinel.to_dict()  # Trigger the initial load, which writes the defaults
+
+    with open(file_path) as f:
+        assert json.load(f)["user"]["username"] is None
+
+    sentinel = make_sentinel(file_path)
+    assert sentinel.get("user.username") is None
+
+
+def test_from_dict_copy_on_write(sentinel_json: Sentinel) -> None:
+    """
+    Test that merging builds a new configuration object.
+
+    Verifies that:
+    - The current configuration object is not modified by a merge
+    - The merged object contains the new and the preserved values
+
+    Args:
+        sentinel_json: Fixture providing a JSON-backed Sentinel
+    """
+    sentinel = sentinel_json
+    sentinel.stop_watching()
+
+    current = sentinel.configuration
+    merged = sentinel._from_dict({"app_name": "MergedApp", "user": {"username": "merged_user"}})
+
+    assert merged is not current
+    assert current.app_name == "MyApp"
+    assert current.user.username is None
+    assert merged.app_name == "MergedApp"
+    assert merged.user.username == "merged_user"
+    assert merged.version == current.version
+
+
+def test_from_dict_generic_merge_matches_generated(sentinel_json: Sentinel, monkeypatch) -> None:
+    """
+    Test that the generic merge gives the same result as the generated merge function.
+
+    Verifies that:
+    - Nested values are merged into the existing nested dataclass
+    - A nested dataclass set to None is rebuilt from the merged values
+
+    Args:
+        sentinel_json: Fixture providing a JSON-backed Sentinel
+        monkeypatch: Pytest fixture for patching attributes
+    """
+    sentinel = sentinel_json
+    sentinel.stop_watching()
+    data = {"app_name": "MergedApp", "user": {"username": "merged_user"}}
+
+    generated = sentinel._from_dict(data)
+    monkeypatch.setattr("config_sentinel.sentinel._compile_merge", lambda cls: None)
+    assert sentinel._from_dict(data) == generated
+
+    sentinel.configuration.user = None
+    merged = sentinel._from_dict(data)
+    assert merged == generated
+    assert merged.user.password is None
+
+
+def test_sentinel_debounces_modifications(sentinel_json: Sentinel, monkeypatch) -> None:
+    """
+    Test that a burst of modification events triggers a single reload.
+
+    Verifies that:
+    - Repeated events for the configuration file are coalesced
+    - Creation and atomic replacement of the configuration file trigger a reload
+    - Events for other files are ignored
+
+    Args:
+        sentinel_json: Fixture providing a JSON-backed Sentinel
+        monkeypatch: Pytest fixture for patching attributes
+    """
+    sentinel = sentinel_json
+    file_path = sentinel.file_path
+    # Stop only the observer, events are delivered by hand and still schedule reloads
+    sentinel._observer.stop()
+    sentinel._observer.join()
+
+    reloads = []
+    monkeypatch.setattr(sentinel, "_load_config", lambda: reloads.append(1))
+
+    sentinel.on_modified(FileModifiedEvent(str(file_path.parent / "other.txt")))
+    sentinel.dispatch(FileCreatedEvent(str(file_path.parent / "other.txt")))
+    sentinel.dispatch(FileMovedEvent(str(file_path.parent / "other.txt"), f"{file_path}.bak"))
+    assert sentinel._reload_timer is None
+
+    for _ in range(5):
+        sentinel.on_modified(FileModifiedEvent(str(file_path)))
+    sentinel.dispatch(FileCreatedEvent(str(file_path)))
+    sentinel.dispatch(FileMovedEvent(f"{file_path}.tmp", str(file_path)))
+    sentinel._reload_timer.join()
+
+    assert len(reloads) == 1
+
+
+def test_sentinel_no_reload_after_stop_watching(sentinel_json: Sentinel, monkeypatch) -> None:
+    """
+    Test that events dispatched after stop_watching() do not schedule a reload.
+
+    Verifies that:
+    - A pending reload is cancelled
+    - An event arriving while the observer shuts down schedules nothing
+
+    Args:
+        sentinel_json: Fixture providing a JSON-backed Sentinel
+        monkeypatch: Pytest fixture for patching attributes
+    """
+    sentinel = sentinel_json
+    file_path = sentinel.file_path
+
+    reloads = []
+    monkeypatch.setattr(sentinel, "_load_config", lambda: reloads.append(1))
+
+    sentinel.on_modified(FileModifiedEvent(str(file_path)))
+    sentinel.stop_watching()
+    sentinel.on_modified(FileModifiedEvent(str(file_path)))
+
+    assert sentinel._reload_timer is None
+    assert not reloads
+
+
+def test_save_config_recreates_missing_directory(cfg_file: Callable[[str], Path], make_sentinel: Callable[..., Sentinel]) -> None:
+    """
+    Test that saving recovers when the configuration directory is removed.
+
+    Verifies that:
+    - Saving into a removed directory raises an OSError
+    - The directory is created again on the next save
+
+    Args:
+        cfg_file: Fixture providing paths for the test's configuration files
+        make_sentinel: Fixture creating Sentinels that are stopped after the test
+    """
+    file_path = cfg_file("nested") / "config.json"
+    sentinel = make_sentinel(file_path)
+    sentinel.save_config()
+
+    file_path.unlink()
+    file_path.parent.rmdir()
+
+    with pytest.raises(OSError):
+        sentinel.save_config()
+
+    sentinel.save_config()
+    assert file_path.exists()
+
+
+def test_sentinel_keeps_invalid_config_file(cfg_file: Callable[[str], Path], make_sentinel: Callable[..., Sentinel]) -> None:
+    """
+    Test that an invalid configuration file is not overwritten with defaults.
+
+    Verifies that:
+    - Default values are used when the file cannot be parsed
+    - The invalid file content is left for the user to fix
+
+    Args:
+        cfg_file: Fixture providing paths for the test's configuration files
+        make_sentinel: Fixture creating Sentinels that are stopped after the test
+    """
+    file_path = cfg_file("config.json")
+    file_path.write_text("{invalid json")
+
+    sentinel = make_sentinel(file_path)
+
+    assert sentinel.get("app_name") == "MyApp"
+    assert file_path.read_text() == "{invalid json"
+
+
+def test_sentinel_lazy_load(cfg_file: Callable[[str], Path], make_sentinel: Callable[..., Sentinel]) -> None:
+    """
+    Test that the configuration file is only loaded on first access.
+
+    Verifies that:
+    - Constructing a Sentinel does not read or create the configuration file
+    - The first access loads the configuration and creates the file
+
+    Args:
+        cfg_file: Fixture providing paths for the test's configuration files
+        make_sentinel: Fixture creating Sentinels that are stopped after the test
+    """
+    file_path = cfg_file("config.json")
+    sentinel = make_sentinel(file_path)
+
+    assert not file_path.exists()
+    assert sentinel.configuration.app_name == "MyApp"
+    assert file_path.exists()
+
+
+def test_save_config_skips_unchanged(sentinel_and_handler: Tuple[Sentinel, object, Path],
+                                     monkeypatch) -> None:
+    """
+    Test that saving an unchanged configuration does not write the file.
+
+    Verifies that:
+    - Saving twice without changes writes once
+    - Changed values and flush() always write
+
+    Args:
+        sentinel_and_handler: Fixture providing test components
+        monkeypatch: Pytest fixture for patching attributes
+    """
+    sentinel, handler, _ = sentinel_and_handler
+    sentinel.stop_watching()
+    sentinel.save_config()
+
+    saves = []
+    original_save = handler.save
+    monkeypatch.setattr(handler, "save", lambda data: saves.append(data) or original_save(data))
+
+    sentinel.save_config()
+    assert not saves
+
+    sentinel.set("debug", True)
+    assert len(saves) == 1
+
+    sentinel.flush()
+    assert len(saves) == 2
+
+
+def test_save_config_after_external_change(sentinel_and_handler: Tuple[Sentinel, object, Path]) -> None:
+    """
+    Test that saving the previously saved data after an external change writes the file.
+
+    Verifies that:
+    - A reload does not let a value equal to the last saved one skip the write
+
+    Args:
+        sentinel_and_handler: Fixture providing test components
+    """
+    sentinel, handler, _ = sentinel_and_handler
+    sentinel.stop_watching()
+    sentinel.set("app_name", "A")
+
+    handler.save({"app_name": "B"})
+    sentinel._load_config()
+    assert sentinel.get("app_name") == "B"
+
+    sentinel.set("app_name", "A")
+    assert handler.load()["app_name"] == "A"
+
+
+def test_sentinel_update_saves_once(sentinel_and_handler: Tuple[Sentinel, object, Path],
+                                    monkeypatch) -> None:
+    """
+    Test that update() and batch() write the configuration file once.
+
+    Verifies that:
+    - update() applies every value with a single save
+    - Saves inside nested batch() blocks are deferred to the outermost exit
+
+    Args:
+        sentinel_and_handler: Fixture providing test components
+        monkeypatch: Pytest fixture for patching attributes
+    """
+    sentinel, handler, _ = sentinel_and_handler
+    sentinel.stop_watching()
+    sentinel.save_config()
+
+    saves = []
+    original_save = handler.save
+    monkeypatch.setattr(handler, "save", lambda data: saves.append(data) or original_save(data))
+
+    sentinel.update({"debug": True, "app_name": "Batched", "user.username": "batch"})
+    assert len(saves) == 1
+    assert saves[0]["app_name"] == "Batched"
+    assert saves[0]["user"]["username"] == "batch"
+
+    with sentinel.batch():
+        sentinel.set("debug", False)
+        with sentinel.batch():
+            sentinel.set("app_name", "Nested")
+        assert len(saves) == 1
+    assert len(saves) == 2
+    assert handler.load()["app_name"] == "Nested"
+
+
+def test_sentinel_batch_does_not_defer_other_threads(sentinel_and_handler: Tuple[Sentinel, object, Path]) \
+        -> None:
+    """
+    Test that a batch in one thread does not defer saves made by another thread.
+
+    Verifies that:
+    - set() from another thread waits for the batch to exit
+    - Its value is saved by the other thread itself
+
+    Args:
+        sentinel_and_handler: Fixture providing test components
+    """
+    sentinel, handler, _ = sentinel_and_handler
+    sentinel.stop_watching()
+    sentinel.save_config()
+
+    setter = Thread(target=sentinel.set, args=("user.username", "other_thread"))
+    with sentinel.batch():
+        sentinel.set("app_name", "Batched")
+        setter.start()
+        setter.join(timeout=0.2)
+        assert setter.is_alive()
+    setter.join()
+
+    assert handler.load()["app_name"] == "Batched"
+    assert handler.load()["user"]["username"] == "other_thread"
+
+
+def test_sentinel_instances_per_file(cfg_file: Callable[[str], Path], make_sentinel: Callable[..., Sentinel]) -> None:
+    """
+    Test that each configuration file gets its own Sentinel.
+
+    Verifies that:
+    - Sentinels for different files are independent
+    - Stopping a Sentinel releases it, so a new one is created for its file
+
+    Args:
+        cfg_file: Fixture providing paths for the test's configuration files
+        make_sentinel: Fixture creating Sentinels that are stopped after the test
+    """
+    first = make_sentinel(cfg_file("first.json"), watching=True)
+    second = make_sentinel(cfg_file("second.yaml"), handler_class=YAMLHandler, watching=True)
+    assert first is not second
+
+    first.set("app_name", "First")
+    assert second.get("app_name") == "MyApp"
+
+    first.stop_watching()
+    second.stop_watching()
+
+    reopened = make_sentinel(cfg_file("first.json"))
+    assert reopened is not first
+    assert reopened.get("app_name") == "First"
+
+
+def test_sentinel_string_annotations(cfg_file: Callable[[str], Path], make_sentinel: Callable[..., Sentinel]) -> None:
+    """
+    Test that nested dataclasses declared with string annotations are merged.
+
+    Verifies that:
+    - Nested values merge into the nested dataclass instead of replacing it
+
+    Args:
+        cfg_file: Fixture providing paths for the test's configuration files
+        make_sentinel: Fixture creating Sentinels that are stopped after the test
+    """
+    file_path = cfg_file("config.json")
+    JSONHandler(file_path).save({"user": {"username": "annotated"}})
+
+    sentinel = make_sentinel(file_path, config_model=AnnotatedConfig)
+
+    assert isinstance(sentinel.configuration.user, UserConfig)
+    assert sentinel.to_dict()["user"] == {"username": "annotated", "password": None}
+
+
+def test_sentinel_partly_resolvable_annotations(cfg_file: Callable[[str], Path], make_sentinel: Callable[..., Sentinel]) -> None:
+    """
+    Test that an unresolvable annotation does not affect the other fields.
+
+    Verifies that:
+    - Nested dataclasses are still merged when another annotation cannot be resolved
+    - Nested defaults are kept
+
+    Args:
+        cfg_file: Fixture providing paths for the test's configuration files
+        make_sentinel: Fixture creating Sentinels that are stopped after the test
+    """
+    file_path = cfg_file("config.json")
+    JSONHandler(file_path).save({"user": {"username": "annotated"}, "threshold": 1})
+
+    sentinel = make_sentinel(file_path, config_model=PartlyAnnotatedConfig)
+
+    assert isinstance(sentinel.configuration.user, UserConfig)
+    assert sentinel.to_dict() == {"user": {"username": "annotated", "password": None}, "threshold": 1}
+
+
+def test_sentinel_reloads_restored_config_after_error(cfg_file: Callable[[str], Path], make_sentinel: Callable[..., Sentinel]) -> None:
+    """
+    Test that restoring a configuration file after a parse error reloads it.
+
+    Verifies that:
+    - An invalid file resets the configuration to defaults
+    - Restoring the previous contents loads them again
+
+    Args:
+        cfg_file: Fixture providing paths for the test's configuration files
+        make_sentinel: Fixture creating Sentinels that are stopped after the test
+    """
+    file_path = cfg_file("config.json")
+    good = b'{"app_name": "Good"}'
+    file_path.write_bytes(good)
+
+    sentinel = make_sentinel(file_path)
+    assert sentinel.get("app_name") == "Good"
+
+    file_path.write_bytes(b"{broken")
+    sentinel._load_config()
+    assert sentinel.get("app_name") == "MyApp"
+
+    file_path.write_bytes(good)
+    sentinel._load_config()
+    assert sentinel.get("app_name") == "Good"
+
+
+def test_sentinel_set_during_reload_is_kept(sentinel_and_handler: Tuple[Sentinel, object, Path],
+                                            monkeypatch) -> None:
+    """
+    Test that a value set while a reload is merging is not lost.
+
+    Verifies that:
+    - set() waits for the reloaded configuration to be swapped in
+    - The value set concurrently is applied to the reloaded configuration
+
+    Args:
+        sentinel_and_handler: Fixture providing test components
+        monkeypatch: Pytest fixture for patching attributes
+    """
+    sentinel, handler, file_path = sentinel_and_handler
+    sentinel.stop_watching()
+    sentinel.to_dict()  # Trigger the initial load
+
+    original_from_dict = sentinel._from_dict
+    setter = Thread(target=sentinel.set, args=("user.username", "concurrent_user"))
+
+    def from_dict(data: dict) -> Any:
+        merged = original_from_dict(data)
+        # Set a value between copying the configuration and swapping in the copy
+        setter.start()
+        setter.join(timeout=0.2)
+        return merged
+
+    monkeypatch.setattr(sentinel, "_from_dict", from_dict)
+    handler.save({"app_name": "ExternalApp"})
+    sentinel._load_config()
+    setter.join()
+
+    assert sentinel.get("app_name") == "ExternalApp"
+    assert sentinel.get("user.username") == "concurrent_user"
+
+
+def test_sentinel_instances_share_resolved_path(cfg_file: Callable[[str], Path], make_sentinel: Callable[..., Sentinel], monkeypatch) -> None:
+    """
+    Test that different spellings of one configuration file share a Sentinel.
+
+    Verifies that:
+    - Relative and absolute paths to the same file return the same instance
+    - Stopping the instance releases it under either spelling
+
+    Args:
+        cfg_file: Fixture providing paths for the test's configuration files
+        make_sentinel: Fixture creating Sentinels that are stopped after the test
+        monkeypatch: Pytest fixture for patching attributes
+    """
+    file_path = cfg_file("config.json")
+    monkeypatch.chdir(file_path.parent)
+    relative = make_sentinel(Path(file_path.name), watching=True)
+    absolute = make_sentinel(file_path.parent / "sub" / ".." / file_path.name, watching=True)
+    assert relative is absolute
+
+    relative.stop_watching()
+    reopened = make_sentinel(file_path)
+    assert reopened is not relative
+
+
+def test_sentinel_concurrent_construction(cfg_file: Callable[[str], Path], make_sentinel: Callable[..., Sentinel], monkeypatch) -> None:
+    """
+    Test that constructing one Sentinel from several threads initializes it once.
+
+    Verifies that:
+    - All threads get the same instance
+    - A single file observer is started
+
+    Args:
+        cfg_file: Fixture providing paths for the test's configuration files
+        make_sentinel: Fixture creating Sentinels that are stopped after the test
+        monkeypatch: Pytest fixture for patching attributes
+    """
+    file_path = cfg_file("config.json")
+    started = []
+    original_start = Observer.start
+
+    def start(observer) -> None:
+        started.append(observer)
+        # Widen the window in which other threads could start initializing the instance
+        time.sleep(0.05)
+        original_start(observer)
+
+    monkeypatch.setattr(Observer, "start", start)
+    instances = []
+    threads = [
+        Thread(target=lambda: instances.append(make_sentinel(file_path, watching=True)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(instance is instances[0] for instance in instances)
+    assert len(started) == 1